@@ -277,7 +277,7 @@ async def ingest_azure_ad(
     
     try:
         # Validate schema
-        validated_event = AzureADSignInEvent(**event)
+        validated_event = AzureADSignInEvent.model_validate(event)
         
         # Add metadata
         enriched_event = {
@@ -350,7 +350,7 @@ async def ingest_cloudtrail(
     
     try:
         # Validate schema
-        validated_event = CloudTrailEvent(**event)
+        validated_event = CloudTrailEvent.model_validate(event)
         
         # Add metadata
         enriched_event = {
@@ -423,7 +423,7 @@ async def ingest_api_gateway(
     
     try:
         # Validate schema
-        validated_event = APIGatewayLog(**event)
+        validated_event = APIGatewayLog.model_validate(event)
         
         # Add metadata
         enriched_event = {
@@ -504,6 +504,9 @@ async def ingest_batch(
             detail=f"Invalid source_type: {source_type}"
         )
     
+    # Intern so downstream dispatch-table lookups hit the identity fast path
+    source_type = sys.intern(source_type)
+    
     results = {
         "total": len(events),
         "accepted": 0,
@@ -511,28 +514,34 @@ async def ingest_batch(
         "errors": []
     }
     
+    # One wall-clock read per batch; events are told apart by index
+    ingested_at = datetime.utcnow()
+    ingestion_timestamp = ingested_at.isoformat()
+    ingestion_id_prefix = f"ingest_batch_{ingested_at.timestamp()}_"
+    
     for idx, event in enumerate(events):
-        try:
-            # Add source type and metadata
-            event["source_type"] = source_type
-            event["ingestion_timestamp"] = datetime.utcnow().isoformat()
-            event["ingestion_id"] = f"ingest_batch_{datetime.utcnow().timestamp()}_{idx}"
-            
-            # Queue for processing
-            success = await event_queue.put(event, timeout=0.1)
-            
-            if success:
-                results["accepted"] += 1
-                metrics["events_ingested_total"] += 1
-                metrics["events_by_source"][source_type] += 1
-            else:
-                results["rejected"] += 1
-                results["errors"].append(f"Event {idx}: Queue full")
-        
-        except Exception as e:
+        # Add source type and metadata
+        event["source_type"] = source_type
+        event["ingestion_timestamp"] = ingestion_timestamp
+        event["ingestion_id"] = f"{ingestion_id_prefix}{idx}"
+    
+    # Queue the whole batch for processing in one call
+    try:
+        queued = await event_queue.put_many(events)
+    except Exception as e:
+        queued = [False] * len(events)
+        results["errors"].append(f"Batch: {str(e)}")
+        metrics["errors_total"] += 1
+    
+    for idx, success in enumerate(queued):
+        if success:
+            results["accepted"] += 1
+        else:
             results["rejected"] += 1
-            results["errors"].append(f"Event {idx}: {str(e)}")
-            metrics["errors_total"] += 1
+            results["errors"].append(f"Event {idx}: Queue full")
+    
+    metrics["events_ingested_total"] += results["accepted"]
+    metrics["events_by_source"][source_type] += results["accepted"]
     
     return JSONResponse(
         status_code=status.HTTP_207_MULTI_STATUS,
@@ -4,17 +4,32 @@ Hybrid Queue Implementation for ZTBF
 """
 
 import asyncio
+import hashlib
+import os
 import sqlite3
+import struct
 import json
 import time
 import logging
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass
-from typing import Dict, Any, Optional
+from typing import Dict, Any, Optional, List, Callable
 from pathlib import Path
 from datetime import datetime
 
+from pydantic_core import from_json, to_json
+
 logger = logging.getLogger(__name__)
 
+# Overflow payloads use pydantic-core's Rust JSON codec (shipped with
+# pydantic): compact output identical to the stdlib encoder's, faster in
+# both directions, and datetimes serialize instead of raising
+_encode_event = to_json
+_decode_event = from_json
+
+# Compact stdlib encoder for stats snapshots
+_ENCODER = json.JSONEncoder(separators=(",", ":"))
+
 
 @dataclass
 class QueueConfig:
@@ -22,6 +37,8 @@ class QueueConfig:
     max_memory_size: int = 100_000  # Maximum events in memory
     disk_buffer_path: str = "data/queue_overflow.db"
     overflow_strategy: str = "disk"  # "disk" or "drop"
+    overflow_storage: str = "disk"  # "disk", "memdisk", "memory" or "log"
+    snapshot_interval_seconds: float = 5.0  # memdisk only
     enable_stats: bool = True
 
 
@@ -29,32 +46,77 @@ class DiskBuffer:
     """
     SQLite-based disk buffer for overflow events
     Provides persistent storage when memory queue is full
+    
+    Storage modes:
+    - "disk": SQLite database file, every write is durable
+    - "memdisk": in-memory SQLite, periodically snapshotted to db_path
+      (best-effort durability, restored from the snapshot on startup)
+    - "memory": in-memory SQLite only, lost on restart
     """
     
-    def __init__(self, db_path: str):
+    def __init__(
+        self,
+        db_path: str,
+        storage: str = "disk",
+        snapshot_interval: float = 5.0
+    ):
         """
         Initialize disk buffer
         
         Args:
-            db_path: Path to SQLite database file
+            db_path: Path to SQLite database file (snapshot file for memdisk)
+            storage: Storage mode ("disk", "memdisk" or "memory")
+            snapshot_interval: Seconds between snapshots in memdisk mode
         """
+        if storage not in ("disk", "memdisk", "memory"):
+            raise ValueError(f"Unknown overflow storage: {storage}")
+        
         self.db_path = db_path
+        self.storage = storage
+        self.snapshot_interval = snapshot_interval
+        self._snapshot_task: Optional[asyncio.Task] = None
+        
+        # Blocking sqlite3 calls run on a single dedicated thread so the
+        # event loop keeps serving memory-queue traffic, while the shared
+        # connection is never used by two threads at once
+        self._executor = ThreadPoolExecutor(
+            max_workers=1,
+            thread_name_prefix="disk-buffer"
+        )
         
         # Ensure directory exists
-        Path(db_path).parent.mkdir(parents=True, exist_ok=True)
+        if storage != "memory":
+            Path(db_path).parent.mkdir(parents=True, exist_ok=True)
         
         # Initialize database
-        self.conn = sqlite3.connect(db_path, check_same_thread=False)
+        if storage == "disk":
+            self.conn = sqlite3.connect(db_path, check_same_thread=False)
+        else:
+            # Shared-cache memory databases are process-wide by name, so the
+            # name is derived from the full path: buffers for different
+            # files never see each other's events
+            memory_name = hashlib.blake2b(
+                str(Path(db_path).resolve()).encode(), digest_size=16
+            ).hexdigest()
+            self.conn = sqlite3.connect(
+                f"file:overflow-{memory_name}?mode=memory&cache=shared",
+                uri=True,
+                check_same_thread=False
+            )
+            if storage == "memdisk":
+                self._restore_snapshot()
         self._init_db()
         
-        logger.info(f"Disk buffer initialized: {db_path}")
+        # Row count kept in memory (updated by the executor-side reads and
+        # writes) so size checks never touch the connection from the loop
+        self._count = self.conn.execute("SELECT COUNT(*) FROM event_buffer").fetchone()[0]
+        
+        logger.info(f"Disk buffer initialized: {db_path} ({storage})")
     
     def _init_db(self):
-        """Create tables and indexes"""
-        cursor = self.conn.cursor()
-        
+        """Create tables"""
         # Events table
-        cursor.execute("""
+        self.conn.execute("""
             CREATE TABLE IF NOT EXISTS event_buffer (
                 id INTEGER PRIMARY KEY AUTOINCREMENT,
                 timestamp REAL NOT NULL,
@@ -63,21 +125,66 @@ class DiskBuffer:
             )
         """)
         
-        # Index for timestamp-based retrieval
-        cursor.execute("""
-            CREATE INDEX IF NOT EXISTS idx_timestamp 
-            ON event_buffer(timestamp)
-        """)
-        
-        # Index for ID-based retrieval
-        cursor.execute("""
-            CREATE INDEX IF NOT EXISTS idx_id 
-            ON event_buffer(id)
-        """)
+        # Reads are always ORDER BY id, which is served by the rowid b-tree
+        # of the INTEGER PRIMARY KEY. Drop secondary indexes created by
+        # older versions - they only add write amplification on insert.
+        self.conn.execute("DROP INDEX IF EXISTS idx_timestamp")
+        self.conn.execute("DROP INDEX IF EXISTS idx_id")
         
         self.conn.commit()
         logger.info("Disk buffer tables created")
     
+    # ===== MEMDISK SNAPSHOTS =====
+    
+    def _restore_snapshot(self):
+        """Load the last on-disk snapshot into the in-memory database"""
+        if not Path(self.db_path).exists():
+            return
+        
+        try:
+            snapshot_conn = sqlite3.connect(self.db_path)
+            try:
+                snapshot_conn.backup(self.conn)
+            finally:
+                snapshot_conn.close()
+            logger.info(f"Disk buffer restored from snapshot: {self.db_path}")
+        except Exception as e:
+            logger.error(f"Error restoring disk buffer snapshot: {e}")
+    
+    def snapshot(self):
+        """Copy the in-memory database to db_path (memdisk mode only)"""
+        if self.storage != "memdisk":
+            return
+        
+        try:
+            snapshot_conn = sqlite3.connect(self.db_path)
+            try:
+                self.conn.backup(snapshot_conn)
+            finally:
+                snapshot_conn.close()
+        except Exception as e:
+            logger.error(f"Error writing disk buffer snapshot: {e}")
+    
+    async def _snapshot_loop(self):
+        """Periodically snapshot the in-memory database"""
+        while True:
+            await asyncio.sleep(self.snapshot_interval)
+            await self._run_blocking(self.snapshot)
+    
+    def _ensure_snapshot_task(self):
+        """Start the snapshot loop on first use from within the event loop"""
+        if self.storage != "memdisk" or self._snapshot_task is not None:
+            return
+        
+        self._snapshot_task = asyncio.get_running_loop().create_task(
+            self._snapshot_loop()
+        )
+    
+    async def _run_blocking(self, func: Callable, *args) -> Any:
+        """Run a blocking sqlite3 call on the buffer's dedicated thread"""
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(self._executor, func, *args)
+    
     async def write(self, event: Dict[str, Any]) -> bool:
         """
         Write event to disk buffer
@@ -88,16 +195,22 @@ class DiskBuffer:
         Returns:
             True if successful, False otherwise
         """
+        self._ensure_snapshot_task()
+        return await self._run_blocking(self._write_sync, event)
+    
+    def _write_sync(self, event: Dict[str, Any]) -> bool:
+        """Blocking implementation of write()"""
         try:
-            event_json = json.dumps(event)
+            event_json = _encode_event(event).decode()
             timestamp = time.time()
             
-            cursor = self.conn.cursor()
-            cursor.execute(
-                "INSERT INTO event_buffer (timestamp, event_json) VALUES (?, ?)",
-                (timestamp, event_json)
-            )
-            self.conn.commit()
+            # Connection context manager commits on exit (rolls back on error)
+            with self.conn:
+                self.conn.execute(
+                    "INSERT INTO event_buffer (timestamp, event_json) VALUES (?, ?)",
+                    (timestamp, event_json)
+                )
+            self._count += 1
             
             return True
         
@@ -112,31 +225,32 @@ class DiskBuffer:
         Returns:
             Event dictionary or None if buffer is empty
         """
+        return await self._run_blocking(self._read_sync)
+    
+    def _read_sync(self) -> Optional[Dict[str, Any]]:
+        """Blocking implementation of read()"""
         try:
-            cursor = self.conn.cursor()
-            
-            # Get oldest event
-            cursor.execute("""
-                SELECT id, event_json 
-                FROM event_buffer 
-                ORDER BY id 
-                LIMIT 1
-            """)
-            
-            row = cursor.fetchone()
+            with self.conn:
+                # Get oldest event
+                row = self.conn.execute("""
+                    SELECT id, event_json 
+                    FROM event_buffer 
+                    ORDER BY id 
+                    LIMIT 1
+                """).fetchone()
+                
+                if row:
+                    event_id, event_json = row
+                    
+                    # Delete retrieved event
+                    self.conn.execute(
+                        "DELETE FROM event_buffer WHERE id = ?",
+                        (event_id,)
+                    )
             
             if row:
-                event_id, event_json = row
-                event = json.loads(event_json)
-                
-                # Delete retrieved event
-                cursor.execute(
-                    "DELETE FROM event_buffer WHERE id = ?",
-                    (event_id,)
-                )
-                self.conn.commit()
-                
-                return event
+                self._count -= 1
+                return _decode_event(event_json)
             
             return None
         
@@ -144,6 +258,44 @@ class DiskBuffer:
             logger.error(f"Error reading from disk buffer: {e}")
             return None
     
+    async def read_batch(self, max_events: int) -> List[Dict[str, Any]]:
+        """
+        Read up to max_events oldest events from disk buffer (FIFO)
+        
+        Selects and deletes the whole batch in a single transaction.
+        
+        Args:
+            max_events: Maximum number of events to read
+        
+        Returns:
+            List of event dictionaries (empty if buffer is empty)
+        """
+        return await self._run_blocking(self._read_batch_sync, max_events)
+    
+    def _read_batch_sync(self, max_events: int) -> List[Dict[str, Any]]:
+        """Blocking implementation of read_batch()"""
+        try:
+            with self.conn:
+                rows = self.conn.execute("""
+                    SELECT id, event_json 
+                    FROM event_buffer 
+                    ORDER BY id 
+                    LIMIT ?
+                """, (max_events,)).fetchall()
+                
+                if rows:
+                    self.conn.executemany(
+                        "DELETE FROM event_buffer WHERE id = ?",
+                        [(row[0],) for row in rows]
+                    )
+            self._count -= len(rows)
+            
+            return [_decode_event(row[1]) for row in rows]
+        
+        except Exception as e:
+            logger.error(f"Error reading batch from disk buffer: {e}")
+            return []
+    
     def get_size(self) -> int:
         """
         Get number of events in disk buffer
@@ -151,30 +303,230 @@ class DiskBuffer:
         Returns:
             Count of buffered events
         """
-        try:
-            cursor = self.conn.cursor()
-            cursor.execute("SELECT COUNT(*) FROM event_buffer")
-            count = cursor.fetchone()[0]
-            return count
-        except Exception as e:
-            logger.error(f"Error getting disk buffer size: {e}")
-            return 0
+        return self._count
+    
+    async def get_size_async(self) -> int:
+        """
+        Get number of events in disk buffer
+        
+        Returns:
+            Count of buffered events
+        """
+        return self._count
     
     def clear(self):
         """Clear all events from disk buffer"""
+        # Runs on the buffer thread, never inside another call's transaction
+        self._executor.submit(self._clear_sync).result()
+    
+    def _clear_sync(self):
+        """Blocking implementation of clear()"""
         try:
-            cursor = self.conn.cursor()
-            cursor.execute("DELETE FROM event_buffer")
-            self.conn.commit()
+            with self.conn:
+                self.conn.execute("DELETE FROM event_buffer")
+            self._count = 0
             logger.info("Disk buffer cleared")
         except Exception as e:
             logger.error(f"Error clearing disk buffer: {e}")
     
     def close(self):
         """Close database connection"""
+        if self._snapshot_task is not None:
+            self._snapshot_task.cancel()
+            self._snapshot_task = None
+        
+        # Let in-flight reads/writes finish before closing the connection
+        self._executor.shutdown(wait=True)
+        
+        # Final snapshot so a clean shutdown loses nothing
+        self.snapshot()
+        
         self.conn.close()
         logger.info("Disk buffer closed")
 
+
+class FileFrameBuffer:
+    """
+    Append-only log buffer for overflow events
+    
+    Events are written once and read once in FIFO order, so no B-tree,
+    transaction or index is needed. Each event is stored as a frame:
+    
+        [4-byte big-endian length][JSON payload]
+    
+    Payloads use the module's pydantic-core JSON codec, as DiskBuffer
+    rows do, rather than msgpack: msgpack is not a dependency, and the
+    win of this format is the append-only file, not the payload codec
+    (pydantic-core encodes in C, and raw events are mostly strings that
+    msgpack would not shrink).
+    
+    The read head offset is kept in a small sidecar file so consumed
+    events are not replayed after a restart. The log is truncated once
+    fully drained. Writes go to the OS page cache (no fsync), which is
+    fast enough to stay on the event loop.
+    
+    Exposes the same interface as DiskBuffer.
+    """
+    
+    _HEADER = struct.Struct("!I")
+    _OFFSET = struct.Struct("!Q")
+    
+    def __init__(self, log_path: str):
+        """
+        Initialize frame buffer
+        
+        Args:
+            log_path: Path to the append-only log file
+        """
+        self.log_path = log_path
+        
+        # Ensure directory exists
+        Path(log_path).parent.mkdir(parents=True, exist_ok=True)
+        
+        self._fd = os.open(log_path, os.O_RDWR | os.O_CREAT | os.O_APPEND, 0o600)
+        self._head_fd = os.open(f"{log_path}.head", os.O_RDWR | os.O_CREAT, 0o600)
+        
+        self._head = 0
+        self._tail = 0
+        self._count = 0
+        self._recover()
+        
+        logger.info(f"Frame buffer initialized: {log_path} ({self._count} events)")
+    
+    def _recover(self):
+        """Rebuild head/tail/count by scanning the log from the saved head"""
+        saved = os.pread(self._head_fd, self._OFFSET.size, 0)
+        head = self._OFFSET.unpack(saved)[0] if len(saved) == self._OFFSET.size else 0
+        size = os.fstat(self._fd).st_size
+        
+        if head > size:
+            head = 0
+        
+        offset, count = head, 0
+        while offset + self._HEADER.size <= size:
+            (length,) = self._HEADER.unpack(os.pread(self._fd, self._HEADER.size, offset))
+            if offset + self._HEADER.size + length > size:
+                break
+            offset += self._HEADER.size + length
+            count += 1
+        
+        if offset < size:
+            # Partial frame from an interrupted write - discard it
+            logger.warning(f"Discarding {size - offset} trailing bytes in {self.log_path}")
+            os.ftruncate(self._fd, offset)
+        
+        self._head, self._tail, self._count = head, offset, count
+        if count == 0:
+            self._reset()
+    
+    def _save_head(self):
+        """Persist read head offset"""
+        os.pwrite(self._head_fd, self._OFFSET.pack(self._head), 0)
+    
+    def _reset(self):
+        """Truncate the drained log back to empty"""
+        os.ftruncate(self._fd, 0)
+        self._head = self._tail = self._count = 0
+        self._save_head()
+    
+    def _read_frame(self) -> Dict[str, Any]:
+        """Read the frame at head and advance head"""
+        (length,) = self._HEADER.unpack(os.pread(self._fd, self._HEADER.size, self._head))
+        payload = os.pread(self._fd, length, self._head + self._HEADER.size)
+        self._head += self._HEADER.size + length
+        self._count -= 1
+        return _decode_event(payload)
+    
+    async def write(self, event: Dict[str, Any]) -> bool:
+        """
+        Append event to the log
+        
+        Args:
+            event: Event dictionary to write
+        
+        Returns:
+            True if successful, False otherwise
+        """
+        try:
+            payload = _encode_event(event)
+            frame = self._HEADER.pack(len(payload)) + payload
+            os.write(self._fd, frame)
+            self._tail += len(frame)
+            self._count += 1
+            return True
+        
+        except Exception as e:
+            logger.error(f"Error writing to frame buffer: {e}")
+            return False
+    
+    async def read(self) -> Optional[Dict[str, Any]]:
+        """
+        Read oldest event from the log (FIFO)
+        
+        Returns:
+            Event dictionary or None if buffer is empty
+        """
+        events = await self.read_batch(1)
+        return events[0] if events else None
+    
+    async def read_batch(self, max_events: int) -> List[Dict[str, Any]]:
+        """
+        Read up to max_events oldest events from the log (FIFO)
+        
+        Args:
+            max_events: Maximum number of events to read
+        
+        Returns:
+            List of event dictionaries (empty if buffer is empty)
+        """
+        events = []
+        try:
+            while self._count > 0 and len(events) < max_events:
+                events.append(self._read_frame())
+            
+            if self._count == 0:
+                self._reset()
+            elif events:
+                self._save_head()
+        
+        except Exception as e:
+            logger.error(f"Error reading from frame buffer: {e}")
+        
+        return events
+    
+    def get_size(self) -> int:
+        """
+        Get number of events in the log
+        
+        Returns:
+            Count of buffered events
+        """
+        return self._count
+    
+    async def get_size_async(self) -> int:
+        """
+        Get number of events in the log
+        
+        Returns:
+            Count of buffered events
+        """
+        return self._count
+    
+    def clear(self):
+        """Clear all events from the log"""
+        try:
+            self._reset()
+            logger.info("Frame buffer cleared")
+        except Exception as e:
+            logger.error(f"Error clearing frame buffer: {e}")
+    
+    def close(self):
+        """Close log file"""
+        os.close(self._fd)
+        os.close(self._head_fd)
+        logger.info("Frame buffer closed")
+
+
 class HybridQueue:
     """
     Hybrid in-memory + disk queue
@@ -206,7 +558,14 @@ class HybridQueue:
         self.memory_queue = asyncio.Queue(maxsize=config.max_memory_size)
         
         # Disk buffer
-        self.disk_buffer = DiskBuffer(config.disk_buffer_path)
+        if config.overflow_storage == "log":
+            self.disk_buffer = FileFrameBuffer(config.disk_buffer_path)
+        else:
+            self.disk_buffer = DiskBuffer(
+                config.disk_buffer_path,
+                storage=config.overflow_storage,
+                snapshot_interval=config.snapshot_interval_seconds
+            )
         
         # Statistics
         self.stats = {
@@ -219,12 +578,17 @@ class HybridQueue:
             "errors": 0
         }
         
+        # Last encoded stats snapshot (see get_stats_bytes)
+        self._last_stats: Optional[Dict[str, Any]] = None
+        self._last_stats_bytes = b""
+        
         # Lock for thread safety
         self.lock = asyncio.Lock()
         
         logger.info("Hybrid queue initialized")
         logger.info(f"   - Memory capacity: {config.max_memory_size:,} events")
         logger.info(f"   - Overflow strategy: {config.overflow_strategy}")
+        logger.info(f"   - Overflow storage: {config.overflow_storage}")
     
     async def put(self, event: Dict[str, Any], timeout: float = 1.0) -> bool:
         """
@@ -252,6 +616,43 @@ class HybridQueue:
             self.stats["errors"] += 1
             return False
     
+    async def put_many(self, events: List[Dict[str, Any]]) -> List[bool]:
+        """
+        Put a batch of events in queue (in order)
+        
+        Events go straight into the memory queue with put_nowait (no
+        coroutine per event); once it is full the rest take the overflow
+        path one by one, as with put().
+        
+        Args:
+            events: Event dictionaries to enqueue
+        
+        Returns:
+            Per-event acceptance flags (True if accepted, False if dropped)
+        """
+        accepted: List[bool] = []
+        put_nowait = self.memory_queue.put_nowait
+        enqueued = 0
+        
+        for idx, event in enumerate(events):
+            try:
+                put_nowait(event)
+            except asyncio.QueueFull:
+                # Memory queue is full - overflow the remainder
+                for remaining in events[idx:]:
+                    accepted.append(await self._handle_overflow(remaining))
+                break
+            except Exception as e:
+                logger.error(f"Error putting event in queue: {e}")
+                self.stats["errors"] += 1
+                accepted.append(False)
+            else:
+                enqueued += 1
+                accepted.append(True)
+        
+        self.stats["enqueued"] += enqueued
+        return accepted
+    
     async def _handle_overflow(self, event: Dict[str, Any]) -> bool:
         """
         Handle overflow when memory queue is full
@@ -329,6 +730,73 @@ class HybridQueue:
             self.stats["errors"] += 1
             return None
     
+    async def get_many(
+        self,
+        max_events: int,
+        timeout: Optional[float] = 1.0
+    ) -> List[Dict[str, Any]]:
+        """
+        Get up to max_events events from queue (FIFO)
+        
+        Waits only for the first event, then drains whatever else is
+        already in memory, so consumers can process micro-batches with a
+        single await and a single disk refill check.
+        
+        With timeout=None the call blocks (no timer) until an event
+        arrives or the caller is cancelled; the disk buffer is drained
+        first so overflowed events are never stranded behind the wait.
+        
+        Args:
+            max_events: Maximum number of events to return
+            timeout: Timeout in seconds for the first event (None = wait)
+        
+        Returns:
+            List of events (empty if queue is empty)
+        """
+        try:
+            try:
+                events = [self.memory_queue.get_nowait()]
+            except asyncio.QueueEmpty:
+                if timeout is not None:
+                    events = [await asyncio.wait_for(self.memory_queue.get(), timeout=timeout)]
+                else:
+                    events = await self.disk_buffer.read_batch(max_events)
+                    if events:
+                        self.stats["dequeued"] += len(events)
+                        self.stats["disk_reads"] += len(events)
+                        return events
+                    events = [await self.memory_queue.get()]
+            
+            get_nowait = self.memory_queue.get_nowait
+            while len(events) < max_events:
+                try:
+                    events.append(get_nowait())
+                except asyncio.QueueEmpty:
+                    break
+            
+            self.stats["dequeued"] += len(events)
+            
+            # Refill once for the whole batch
+            await self._refill_from_disk()
+            
+            return events
+        
+        except asyncio.TimeoutError:
+            # Memory queue is empty, try disk buffer
+            events = await self.disk_buffer.read_batch(max_events)
+            
+            if events:
+                self.stats["dequeued"] += len(events)
+                self.stats["disk_reads"] += len(events)
+                logger.debug(" %d events retrieved from disk buffer", len(events))
+            
+            return events
+        
+        except Exception as e:
+            logger.error(f"Error getting events from queue: {e}")
+            self.stats["errors"] += 1
+            return []
+    
     async def _refill_from_disk(self):
         """
         Refill memory queue from disk buffer when space is available
@@ -337,7 +805,7 @@ class HybridQueue:
         # Check if we have space in memory queue
         if self.memory_queue.qsize() < self.config.max_memory_size * 0.5:
             # We have space - try to refill from disk
-            disk_size = self.disk_buffer.get_size()
+            disk_size = await self.disk_buffer.get_size_async()
             
             if disk_size > 0:
                 # Refill up to 10% of capacity at a time
@@ -346,17 +814,17 @@ class HybridQueue:
                     int(self.config.max_memory_size * 0.1)
                 )
                 
-                for _ in range(refill_count):
-                    event = await self.disk_buffer.read()
-                    if event:
-                        try:
-                            self.memory_queue.put_nowait(event)
-                            self.stats["disk_reads"] += 1
-                        except asyncio.QueueFull:
-                            # Memory filled up again, stop refilling
-                            # Put event back in disk
-                            await self.disk_buffer.write(event)
-                            break
+                events = await self.disk_buffer.read_batch(refill_count)
+                for idx, event in enumerate(events):
+                    try:
+                        self.memory_queue.put_nowait(event)
+                        self.stats["disk_reads"] += 1
+                    except asyncio.QueueFull:
+                        # Memory filled up again, stop refilling
+                        # Put remaining events back in disk
+                        for remaining in events[idx:]:
+                            await self.disk_buffer.write(remaining)
+                        break
                 
                 if refill_count > 0:
                     logger.info(f" Refilled {refill_count} events from disk to memory")
@@ -391,6 +859,22 @@ class HybridQueue:
             "is_memory_full": memory_size >= self.config.max_memory_size
         }
     
+    def get_stats_bytes(self) -> bytes:
+        """
+        Get queue statistics as compact JSON bytes
+        
+        Re-encodes only when a counter or queue size has changed since
+        the last call; otherwise returns the cached bytes.
+        
+        Returns:
+            UTF-8 encoded JSON statistics
+        """
+        stats = self.get_stats()
+        if stats != self._last_stats:
+            self._last_stats = stats
+            self._last_stats_bytes = _ENCODER.encode(stats).encode()
+        return self._last_stats_bytes
+    
     def reset_stats(self):
         """Reset statistics counters"""
         self.stats = {
@@ -4,14 +4,84 @@ Event Enricher for ZTBF
 """
 import logging
 import hashlib
-from datetime import datetime
-from typing import Dict, Any, Optional
+import socket
+import struct
+import time
+import ipaddress
+from bisect import bisect_right
+from typing import Dict, Any, Optional, List, Tuple
 from dataclasses import dataclass
 import re
 
 logger = logging.getLogger(__name__)
 
 
+# ===== PII PATTERNS =====
+# Compiled once into a single alternation so each string is scanned in one
+# pass; the named group that matched selects the redaction placeholder.
+# Digit patterns never start inside an identifier or right after a ':'
+# (AWS account IDs in ARNs, request IDs); card candidates must also pass
+# the Luhn check.
+_PII_PATTERNS = {
+    "EMAIL": r"[A-Za-z0-9._%+-]+@[A-Za-z0-9.-]+\.[A-Za-z]{2,}",
+    "SSN": r"(?<![:\w])\d{3}-\d{2}-\d{4}\b",
+    "CREDIT_CARD": r"(?<![:\w])(?:\d[ -]?){12,15}\d\b",
+    "PHONE": r"(?<![:\w])(?:\+?\d{1,3}[ .-]?)?(?:\(\d{3}\)|\d{3})[ .-]?\d{3}[ .-]?\d{4}\b",
+}
+_PII_RE = re.compile("|".join(
+    f"(?P<{name}>{pattern})" for name, pattern in _PII_PATTERNS.items()
+))
+
+# Identity/correlation fields the pipeline keys on - never scrubbed
+_PII_EXEMPT_FIELDS = frozenset({
+    "entity_id",
+    "entity_type",
+    "session_id",
+    "source_ip",
+    "source_system",
+    "raw_event_id",
+    "pipeline_version",
+})
+
+
+def _luhn_valid(candidate: str) -> bool:
+    """Luhn checksum over the digits of a card number candidate"""
+    total = 0
+    for position, char in enumerate(reversed([c for c in candidate if c.isdigit()])):
+        digit = int(char)
+        if position % 2:
+            digit = digit * 2 - 9 if digit > 4 else digit * 2
+        total += digit
+    return total % 10 == 0
+
+
+def _redact_pii_match(match: "re.Match") -> str:
+    """Replace a PII match with a placeholder naming its type"""
+    if match.lastgroup == "CREDIT_CARD" and not _luhn_valid(match.group()):
+        return match.group()  # Long numeric ID, not a card number
+    return f"[{match.lastgroup}]"
+
+
+# ===== USER AGENT PATTERNS =====
+# Checked in order; first match wins (Edge UAs also contain "Chrome", etc.)
+_UA_OS_PATTERNS = [
+    ("Windows", re.compile(r"Windows(?: NT)?[ /]?([\d.]+)?")),
+    ("iOS", re.compile(r"(?:iPhone|iPad).*?OS ([\d_]+)")),
+    ("Mac OS X", re.compile(r"Mac OS X ?([\d_.]+)?")),
+    ("Android", re.compile(r"Android ?([\d.]+)?")),
+    ("Linux", re.compile(r"Linux()")),
+]
+_UA_BROWSER_PATTERNS = [
+    ("Edge", re.compile(r"Edg(?:e|A|iOS)?/([\d.]+)")),
+    ("Chrome", re.compile(r"Chrome/([\d.]+)")),
+    ("Firefox", re.compile(r"Firefox/([\d.]+)")),
+    ("Safari", re.compile(r"Version/([\d.]+).*Safari/")),
+]
+_UA_BOT_RE = re.compile(r"bot|crawler|spider|curl|wget|python-requests|aws-cli|boto", re.IGNORECASE)
+_UA_TABLET_RE = re.compile(r"iPad|Tablet")
+_UA_MOBILE_RE = re.compile(r"Mobile|iPhone|Android")
+
+
 @dataclass
 class EnricherConfig:
     """Configuration for event enricher"""
@@ -78,11 +148,22 @@ class EventEnricher:
         # Entity metadata cache (in-memory for MVP)
         self.entity_cache: Dict[str, Dict] = {}
         
+        # Parsed device fingerprints keyed by user agent string (client
+        # supplied, so bounded: cleared when full)
+        self.device_cache: Dict[str, Dict] = {}
+        
         # GeoIP database (mock for MVP, use MaxMind GeoLite2 in production)
         self.geoip_db = self._load_geoip_database()
+        self._geoip_starts, self._geoip_ends, self._geoip_locations = self._build_geoip_index(self.geoip_db)
         
-        # Resource sensitivity rules
+        # Resource sensitivity rules, matched as one keyword alternation
         self.sensitivity_rules = self._load_sensitivity_rules()
+        self._sensitivity_re = re.compile(
+            "|".join(sorted(map(re.escape, self.sensitivity_rules), key=len, reverse=True))
+        )
+        
+        # Sensitivity levels keyed by the resource's identifying fields
+        self.sensitivity_cache: Dict[Tuple, int] = {}
         
         logger.info("🔍 Event Enricher initialized")
         logger.info(f"   - GeoIP: {'enabled' if self.config.enable_geoip else 'disabled'}")
@@ -98,19 +179,50 @@ class EventEnricher:
         Returns:
             Enriched event dictionary
         """
+        return self._enrich_one(normalized_event, in_place=False)
+    
+    async def enrich_many(self, normalized_events: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+        """
+        Enrich a batch of normalized events in one call
+        
+        Args:
+            normalized_events: Normalized event dictionaries
+        
+        Returns:
+            Enriched event dictionaries, in input order
+        """
+        return [self._enrich_one(event, in_place=False) for event in normalized_events]
+    
+    def enrich_in_place(self, normalized_event: Dict[str, Any]) -> Dict[str, Any]:
+        """
+        Enrich a normalized event by mutating it (no copy, no await)
+        
+        For callers that own the normalized dict and don't need it
+        afterwards, e.g. the processor's fused normalize+enrich path.
+        
+        Args:
+            normalized_event: Normalized event dictionary
+        
+        Returns:
+            The same dictionary, enriched
+        """
+        return self._enrich_one(normalized_event, in_place=True)
+    
+    def _enrich_one(self, normalized_event: Dict[str, Any], in_place: bool) -> Dict[str, Any]:
+        """Synchronous enrichment of a single event (shared by all enrich entry points)"""
         try:
-            enriched = normalized_event.copy()
+            enriched = normalized_event if in_place else normalized_event.copy()
             
             # 1. GeoIP enrichment
             if self.config.enable_geoip and enriched.get("source_ip"):
                 if not enriched.get("location"):
-                    location = await self.geoip_lookup(enriched["source_ip"])
+                    location = self.geoip_lookup(enriched["source_ip"])
                     if location:
                         enriched["location"] = location
             
             # 2. Entity metadata enrichment
             if self.config.enable_entity_metadata and enriched.get("entity_id"):
-                entity_metadata = await self.get_entity_metadata(
+                entity_metadata = self.get_entity_metadata(
                     enriched["entity_id"],
                     enriched.get("entity_type")
                 )
@@ -139,26 +251,96 @@ class EventEnricher:
             # Return original event if enrichment fails
             return normalized_event
     
+    # ===== RESOURCE CLASSIFICATION =====
+    
+    def classify_resource_sensitivity(self, resource: Dict[str, Any]) -> int:
+        """
+        Classify resource sensitivity from keywords in its identifiers
+        
+        The highest-level keyword found in the resource type, id, name,
+        service or endpoint wins; resources with no match keep their
+        current level (default 1). Results are cached per identifier
+        tuple, since a batch hits the same few resources repeatedly.
+        
+        Args:
+            resource: Resource context dictionary
+        
+        Returns:
+            Sensitivity level (1-5)
+        """
+        key = (
+            resource.get("type"),
+            resource.get("id"),
+            resource.get("name"),
+            resource.get("service"),
+            resource.get("endpoint")
+        )
+        
+        level = self.sensitivity_cache.get(key)
+        if level is None:
+            text = " ".join(part for part in key if part).lower()
+            rules = self.sensitivity_rules
+            matches = [rules[match.group()] for match in self._sensitivity_re.finditer(text)]
+            level = max(matches) if matches else (resource.get("sensitivity_level") or 1)
+            
+            if len(self.sensitivity_cache) >= 10_000:
+                self.sensitivity_cache.clear()
+            self.sensitivity_cache[key] = level
+        
+        return level
+    
     # ===== GEOIP LOOKUP =====
     
     def _load_geoip_database(self) -> Dict[str, Dict]:
         """
         Load GeoIP database (mock for MVP)
         
+        Keys are IPv4 CIDR blocks.
         In production: Use MaxMind GeoLite2 or ip-api.com
         """
         # Mock database with common IP ranges
         return {
-            "192.168.": {"city": "Local Network", "country": "Private", "latitude": 0.0, "longitude": 0.0},
-            "10.0.": {"city": "Local Network", "country": "Private", "latitude": 0.0, "longitude": 0.0},
-            "172.16.": {"city": "Local Network", "country": "Private", "latitude": 0.0, "longitude": 0.0},
-            "203.0.113.": {"city": "Test Network", "country": "TEST", "latitude": 0.0, "longitude": 0.0},
+            "192.168.0.0/16": {"city": "Local Network", "country": "Private", "latitude": 0.0, "longitude": 0.0},
+            "10.0.0.0/16": {"city": "Local Network", "country": "Private", "latitude": 0.0, "longitude": 0.0},
+            "172.16.0.0/16": {"city": "Local Network", "country": "Private", "latitude": 0.0, "longitude": 0.0},
+            "203.0.113.0/24": {"city": "Test Network", "country": "TEST", "latitude": 0.0, "longitude": 0.0},
             # Sample public IPs
-            "8.8.8.": {"city": "Mountain View", "country": "US", "country_code": "US", "latitude": 37.4056, "longitude": -122.0775},
-            "1.1.1.": {"city": "San Francisco", "country": "US", "country_code": "US", "latitude": 37.7749, "longitude": -122.4194},
+            "8.8.8.0/24": {"city": "Mountain View", "country": "US", "country_code": "US", "latitude": 37.4056, "longitude": -122.0775},
+            "1.1.1.0/24": {"city": "San Francisco", "country": "US", "country_code": "US", "latitude": 37.7749, "longitude": -122.4194},
         }
     
-    async def geoip_lookup(self, ip_address: str) -> Optional[Dict]:
+    def _build_geoip_index(
+        self,
+        geoip_db: Dict[str, Dict]
+    ) -> Tuple[List[int], List[int], List[Dict]]:
+        """
+        Build a sorted interval index over the GeoIP database
+        
+        Each CIDR block becomes an integer range [start, end], sorted by start,
+        so a lookup is a single bisect instead of a scan over all prefixes.
+        
+        Args:
+            geoip_db: Mapping of CIDR block to location
+        
+        Returns:
+            Parallel lists of range starts, range ends and locations
+        """
+        ranges = []
+        for cidr, location in geoip_db.items():
+            network = ipaddress.IPv4Network(cidr)
+            ranges.append((
+                int(network.network_address),
+                int(network.broadcast_address),
+                location
+            ))
+        ranges.sort(key=lambda r: r[0])
+        
+        starts = [r[0] for r in ranges]
+        ends = [r[1] for r in ranges]
+        locations = [r[2] for r in ranges]
+        return starts, ends, locations
+    
+    def geoip_lookup(self, ip_address: str) -> Optional[Dict]:
         """
         Lookup geographic location from IP address
         
@@ -169,14 +351,21 @@ class EventEnricher:
             Location dictionary or None
         """
         try:
-            # Check cache (prefix-based for simplicity)
-            for prefix, location in self.geoip_db.items():
-                if ip_address.startswith(prefix):
-                    logger.debug(f"GeoIP lookup: {ip_address} → {location['city']}, {location['country']}")
+            try:
+                ip_int = struct.unpack("!I", socket.inet_aton(ip_address))[0]
+            except OSError:
+                # Not an IPv4 address (e.g. IPv6) - no ranges to match
+                ip_int = None
+            
+            if ip_int is not None:
+                idx = bisect_right(self._geoip_starts, ip_int) - 1
+                if idx >= 0 and ip_int <= self._geoip_ends[idx]:
+                    location = self._geoip_locations[idx]
+                    logger.debug("GeoIP lookup: %s → %s, %s", ip_address, location['city'], location['country'])
                     return location
             
             # Default to unknown
-            logger.debug(f"GeoIP lookup: {ip_address} → Unknown")
+            logger.debug("GeoIP lookup: %s → Unknown", ip_address)
             return {
                 "city": "Unknown",
                 "country": "Unknown",
@@ -189,9 +378,98 @@ class EventEnricher:
             logger.warning(f"GeoIP lookup failed for {ip_address}: {e}")
             return None
     
+    # ===== DEVICE FINGERPRINT =====
+    
+    def parse_user_agent(self, user_agent: str) -> Optional[Dict]:
+        """
+        Parse user agent string into a device fingerprint
+        
+        The device_id is a BLAKE2b digest of the user agent, so identical
+        clients share a stable fingerprint without storing the raw string.
+        
+        Args:
+            user_agent: User agent string
+        
+        Returns:
+            Device fingerprint dictionary or None
+        """
+        cached = self.device_cache.get(user_agent)
+        if cached is not None:
+            return dict(cached)
+        
+        try:
+            os_name, os_version = None, None
+            for name, pattern in _UA_OS_PATTERNS:
+                match = pattern.search(user_agent)
+                if match:
+                    os_name = name
+                    os_version = match.group(1).replace("_", ".") if match.group(1) else None
+                    break
+            
+            browser, browser_version = None, None
+            for name, pattern in _UA_BROWSER_PATTERNS:
+                match = pattern.search(user_agent)
+                if match:
+                    browser, browser_version = name, match.group(1)
+                    break
+            
+            is_bot = _UA_BOT_RE.search(user_agent) is not None
+            is_tablet = _UA_TABLET_RE.search(user_agent) is not None
+            is_mobile = not is_tablet and _UA_MOBILE_RE.search(user_agent) is not None
+            
+            if is_bot:
+                device_type = "server"
+            elif is_tablet:
+                device_type = "tablet"
+            elif is_mobile:
+                device_type = "mobile"
+            else:
+                device_type = "desktop"
+            
+            device = {
+                "device_id": hashlib.blake2b(user_agent.encode(), digest_size=16).hexdigest(),
+                "device_type": device_type,
+                "os": os_name,
+                "os_version": os_version,
+                "browser": browser,
+                "browser_version": browser_version,
+                "is_mobile": is_mobile,
+                "is_bot": is_bot
+            }
+            
+            if len(self.device_cache) >= 10_000:
+                self.device_cache.clear()
+            self.device_cache[user_agent] = device
+            return dict(device)
+        
+        except Exception as e:
+            logger.warning(f"User agent parsing failed for {user_agent}: {e}")
+            return None
+    
+    # ===== PII ANONYMIZATION =====
+    
+    def _anonymize_pii(self, event: Dict[str, Any]) -> Dict[str, Any]:
+        """
+        Redact PII (emails, SSNs, card and phone numbers) from free-text fields
+        
+        Walks the top-level string values once with a single precompiled
+        pattern. Identity fields in _PII_EXEMPT_FIELDS are left intact.
+        
+        Args:
+            event: Enriched event dictionary (modified in place)
+        
+        Returns:
+            Event dictionary with PII redacted
+        """
+        for key, value in event.items():
+            if type(value) is str and key not in _PII_EXEMPT_FIELDS:
+                event[key] = _PII_RE.sub(_redact_pii_match, value)
+        
+        return event
+    
     # ===== ENTITY METADATA =====
     
-    async def get_entity_metadata(
+    def get_entity_metadata(
         self,
         entity_id: str,
         entity_type: Optional[str] = None
@@ -207,13 +485,13 @@ class EventEnricher:
             Entity metadata dictionary or None
         """
         try:
+            now = time.monotonic()
+            
             # Check cache
-            if entity_id in self.entity_cache:
-                cached = self.entity_cache[entity_id]
-                # Check if cache is still valid (TTL)
-                if (datetime.utcnow() - cached["cached_at"]).seconds < self.config.entity_cache_ttl:
-                    logger.debug(f"Entity metadata (cached): {entity_id}")
-                    return cached["metadata"]
+            cached = self.entity_cache.get(entity_id)
+            if cached is not None and now < cached["expires_at"]:
+                logger.debug("Entity metadata (cached): %s", entity_id)
+                return cached["metadata"]
             
             # Fetch metadata (mock for MVP)
             metadata = self._fetch_entity_metadata(entity_id, entity_type)
@@ -221,10 +499,10 @@ class EventEnricher:
             # Cache metadata
             self.entity_cache[entity_id] = {
                 "metadata": metadata,
-                "cached_at": datetime.utcnow()
+                "expires_at": now + self.config.entity_cache_ttl
             }
             
-            logger.debug(f"Entity metadata (fetched): {entity_id}")
+            logger.debug("Entity metadata (fetched): %s", entity_id)
             return metadata
         
         except Exception as e:
@@ -276,4 +554,4 @@ class EventEnricher:
             }
 
 
-    
\ No newline at end of file
+    
@@ -4,26 +4,141 @@ Event Normalizer for ZTBF
 """
 
 import logging
-from datetime import datetime
-from typing import Dict, Any, Optional, Callable
+import time
+from datetime import datetime, timezone
+from typing import Dict, Any, Optional, Callable, List, Tuple, Union
+import pandas as pd
+import pyarrow as pa
 from data_pipeline.schemas.unified_schema import (
-    UnifiedEvent,
     EntityType,
     EventType,
-    LocationContext,
-    DeviceFingerprint,
-    ResourceContext,
-    TemporalContext
+    RiskLevel
 )
 
 logger = logging.getLogger(__name__)
 
+# Input accepted by the per-source normalize_batch_* methods: raw event
+# dicts, or a columnar batch with one column per source field
+RawBatch = Union[List[Dict[str, Any]], pa.RecordBatch, pa.Table]
+
+
+# ===== CLASSIFICATION SETS =====
+
+# CloudTrail userIdentity.type values (lowercased) -> entity type
+_IDENTITY_ENTITY_TYPES = {
+    "assumedrole": EntityType.SERVICE.value,
+    "awsservice": EntityType.SERVICE.value,
+    "federated": EntityType.SERVICE.value,
+    "iamuser": EntityType.USER.value,
+    "root": EntityType.USER.value,
+}
+
+# Azure AD deviceDetail.operatingSystem values (lowercased)
+_MOBILE_OS_NAMES = frozenset({"ios", "android"})
+
+# Risk levels UnifiedEvent accepts; other Azure AD values become None
+_RISK_LEVELS = frozenset(level.value for level in RiskLevel)
+
+
+# Enum values bound once; events carry plain strings (UnifiedEvent
+# validates them as Literals)
+_ENTITY_USER = EntityType.USER.value
+_ENTITY_SERVICE = EntityType.SERVICE.value
+_ENTITY_UNKNOWN = EntityType.UNKNOWN.value
+_EVENT_AUTHENTICATION = EventType.AUTHENTICATION.value
+_EVENT_CLOUD_API = EventType.CLOUD_API.value
+_EVENT_API_CALL = EventType.API_CALL.value
+
+
+# ===== TIMESTAMP PARSING =====
+
+def _parse_iso_utc(value: Any) -> Optional[datetime]:
+    """
+    Parse an ISO 8601 value to a naive UTC datetime (None if unparseable)
+    
+    Uses the C datetime.fromisoformat parser; explicit offsets are
+    converted to UTC and datetime values pass through.
+    """
+    if isinstance(value, str):
+        if not value:
+            return None
+        if value[-1] == 'Z':
+            value = value[:-1]
+        try:
+            parsed = datetime.fromisoformat(value)
+        except ValueError:
+            return None
+    elif isinstance(value, datetime):
+        parsed = value
+    else:
+        return None
+    
+    if parsed.tzinfo is not None:
+        parsed = parsed.astimezone(timezone.utc).replace(tzinfo=None)
+    return parsed
+
+
+# ===== TEMPORAL FEATURES =====
+
+# Distinct event hours kept by EventNormalizer's temporal feature cache
+_TEMPORAL_CACHE_SIZE = 4096
+
 
 class NormalizationError(Exception):
     """Custom exception for normalization errors"""
     pass
 
 
+# Failures expected from malformed source events (missing/None fields,
+# wrong types); anything else is a bug and propagates unwrapped
+_EVENT_ERRORS = (KeyError, TypeError, ValueError, AttributeError, IndexError)
+
+
+class RateLimitedLogger:
+    """
+    Token-bucket limiter for repetitive log lines
+    
+    Each key (e.g. source type + error class) gets its own bucket, so an
+    error storm from one source costs a bounded number of log calls and
+    doesn't hide failures from another. Suppressed lines are counted and
+    reported with the next line that gets through.
+    """
+    
+    def __init__(self, rate_per_second: float = 1.0, burst: int = 10):
+        """
+        Initialize limiter
+        
+        Args:
+            rate_per_second: Sustained log lines per second per key
+            burst: Lines allowed back to back before limiting kicks in
+        """
+        self.rate_per_second = rate_per_second
+        self.burst = burst
+        
+        # key -> [tokens, last refill (monotonic), suppressed count]
+        self._buckets: Dict[Tuple, List[float]] = {}
+    
+    def warning(self, key: Tuple, message: str):
+        """Log message at WARNING level unless the key's bucket is empty"""
+        now = time.monotonic()
+        bucket = self._buckets.get(key)
+        if bucket is None:
+            bucket = self._buckets[key] = [float(self.burst), now, 0]
+        else:
+            bucket[0] = min(self.burst, bucket[0] + (now - bucket[1]) * self.rate_per_second)
+            bucket[1] = now
+        
+        if bucket[0] < 1.0:
+            bucket[2] += 1
+            return
+        
+        bucket[0] -= 1.0
+        if bucket[2]:
+            message = f"{message} ({bucket[2]} similar suppressed)"
+            bucket[2] = 0
+        logger.warning(message)
+
+
 class EventNormalizer:
     """
     Normalizes events from various sources to unified schema
@@ -43,10 +158,27 @@ class EventNormalizer:
             "api_gateway": self.normalize_api_gateway
         }
         
+        # Bound lookup for the per-event dispatch in normalize()
+        self._dispatch_get = self.source_mappers.get
+        
+        # Temporal features by event hour (every TemporalContext field is
+        # hour-granular); keyed by proleptic ordinal * 24 + hour
+        self._temporal_cache: Dict[int, Dict[str, Any]] = {}
+        
+        # Shared limiter for per-event failure logging
+        self._failure_log = RateLimitedLogger()
+        
+        # Columnar mappers used by normalize_batch()
+        self.batch_mappers: Dict[str, Callable] = {
+            "azure_ad": self.normalize_batch_azure_ad,
+            "cloudtrail": self.normalize_batch_cloudtrail,
+            "api_gateway": self.normalize_batch_api_gateway
+        }
+        
         logger.info("Event Normalizer initialized")
         logger.info(f"   - Supported sources: {list(self.source_mappers.keys())}")
     
-    async def normalize(self, raw_event: Dict[str, Any]) -> Dict[str, Any]:
+    def normalize(self, raw_event: Dict[str, Any]) -> Dict[str, Any]:
         """
         Normalize event to unified schema
         
@@ -59,33 +191,229 @@ class EventNormalizer:
         Raises:
             NormalizationError: If normalization fails
         """
-        try:
-            source_type = raw_event.get("source_type")
-            
+        source_type = raw_event.get("source_type")
+        
+        # Get source-specific mapper (single lookup, one branch)
+        mapper = self._dispatch_get(source_type)
+        
+        if mapper is None:
             if not source_type:
                 raise NormalizationError("Missing source_type field")
+            raise NormalizationError(f"Unknown source type: {source_type}")
+        
+        # Normalize (mappers log and wrap expected event errors themselves)
+        normalized = mapper(raw_event)
+        
+        # Add processing timestamp
+        normalized["processing_timestamp"] = datetime.utcnow()
+        
+        return normalized
+    
+    # ===== BATCH NORMALIZATION =====
+    
+    def normalize_batch(
+        self,
+        raw_events: List[Dict[str, Any]]
+    ) -> Tuple[List[Dict[str, Any]], List[Dict[str, Any]]]:
+        """
+        Normalize a batch of events, vectorizing per-source column work
+        
+        Events are grouped by source_type; timestamp parsing and temporal
+        feature extraction run once per column instead of once per event.
+        
+        Args:
+            raw_events: Raw events from data sources (any mix of sources)
+        
+        Returns:
+            Tuple of (normalized events, raw events that failed to normalize)
+        """
+        by_source: Dict[str, List[Dict[str, Any]]] = {}
+        failed: List[Dict[str, Any]] = []
+        
+        for raw_event in raw_events:
+            source_type = raw_event.get("source_type")
+            if source_type in self.batch_mappers:
+                by_source.setdefault(source_type, []).append(raw_event)
+            else:
+                failed.append(raw_event)
+        
+        normalized: List[Dict[str, Any]] = []
+        processing_timestamp = datetime.utcnow()
+        
+        for source_type, events in by_source.items():
+            source_normalized, source_failed = self.batch_mappers[source_type](events)
+            for event in source_normalized:
+                event["processing_timestamp"] = processing_timestamp
+            normalized.extend(source_normalized)
+            failed.extend(source_failed)
+        
+        return normalized, failed
+    
+    def normalize_batch_azure_ad(
+        self,
+        events: RawBatch
+    ) -> Tuple[List[Dict[str, Any]], List[Dict[str, Any]]]:
+        """Normalize a batch of Azure AD sign-in events (dicts or Arrow batch)"""
+        return self._normalize_batch(events, "createdDateTime", self._build_azure_ad)
+    
+    def normalize_batch_cloudtrail(
+        self,
+        events: RawBatch
+    ) -> Tuple[List[Dict[str, Any]], List[Dict[str, Any]]]:
+        """Normalize a batch of AWS CloudTrail events (dicts or Arrow batch)"""
+        return self._normalize_batch(events, "eventTime", self._build_cloudtrail)
+    
+    def normalize_batch_api_gateway(
+        self,
+        events: RawBatch
+    ) -> Tuple[List[Dict[str, Any]], List[Dict[str, Any]]]:
+        """Normalize a batch of API Gateway log entries (dicts or Arrow batch)"""
+        return self._normalize_batch(events, "timestamp", self._build_api_gateway)
+    
+    def _normalize_batch(
+        self,
+        events: RawBatch,
+        timestamp_field: str,
+        builder: Callable
+    ) -> Tuple[List[Dict[str, Any]], List[Dict[str, Any]]]:
+        """
+        Normalize events of a single source type
+        
+        Arrow input has its timestamp columns parsed straight from the
+        columns; rows are only materialized as dicts for the builders.
+        
+        Args:
+            events: Raw events of one source type (dicts or Arrow batch)
+            timestamp_field: Name of the event time field for this source
+            builder: Source-specific _build_* method
+        
+        Returns:
+            Tuple of (normalized events, raw events that failed to normalize)
+        """
+        if isinstance(events, (pa.RecordBatch, pa.Table)):
+            timestamp_values = self._arrow_column(events, timestamp_field)
+            ingestion_values = self._arrow_column(events, "ingestion_timestamp")
+            events = events.to_pylist()
+        else:
+            timestamp_values = [e.get(timestamp_field) for e in events]
+            ingestion_values = [e.get("ingestion_timestamp") for e in events]
+        
+        timestamps = self._parse_timestamps_batch(timestamp_values)
+        ingestion_timestamps = self._parse_timestamps_batch(ingestion_values)
+        temporals = self._extract_temporal_features_batch(timestamps)
+        
+        normalized: List[Dict[str, Any]] = []
+        failed: List[Dict[str, Any]] = []
+        
+        for event, timestamp, temporal, ingestion_timestamp in zip(
+            events,
+            timestamps,
+            temporals,
+            ingestion_timestamps
+        ):
+            try:
+                normalized.append(builder(event, timestamp, temporal, ingestion_timestamp))
+            except _EVENT_ERRORS as e:
+                source_type = event.get("source_type")
+                self._failure_log.warning(
+                    (source_type, type(e)),
+                    f"Batch normalization failed for {source_type} event: {e}"
+                )
+                failed.append(event)
+        
+        return normalized, failed
+    
+    def _arrow_column(
+        self,
+        batch: Union[pa.RecordBatch, pa.Table],
+        name: str
+    ) -> Union[pd.Series, List[None]]:
+        """Get a column of an Arrow batch as a Series (all None if absent)"""
+        if name not in batch.schema.names:
+            return [None] * batch.num_rows
+        return batch.column(name).to_pandas()
+    
+    def _parse_timestamps_batch(
+        self,
+        values: Union[pd.Series, List[Optional[str]]]
+    ) -> List[Optional[datetime]]:
+        """
+        Parse a column of ISO 8601 values to naive UTC datetimes
+        
+        Lists are parsed value by value with the C fromisoformat parser,
+        which beats pandas' ISO8601 path at micro-batch sizes; repeated
+        strings (e.g. the shared ingestion_timestamp of an API batch) are
+        parsed once and the datetime shared. Series (e.g. Arrow columns,
+        possibly already typed) go through pandas. Unparseable or missing
+        values become None.
+        """
+        if not isinstance(values, pd.Series):
+            try:
+                parsed_by_value = dict.fromkeys(values)
+            except TypeError:  # unhashable raw values
+                parsed_by_value = None
+            if parsed_by_value is None or len(parsed_by_value) == len(values):
+                return [_parse_iso_utc(value) for value in values]
+            for value in parsed_by_value:
+                parsed_by_value[value] = _parse_iso_utc(value)
+            return [parsed_by_value[value] for value in values]
+        
+        parsed = pd.to_datetime(
+            values,
+            utc=True,
+            format="ISO8601",
+            errors="coerce"
+        ).dt.tz_localize(None)
+        return [None if ts is pd.NaT else ts.to_pydatetime() for ts in parsed]
+    
+    def _extract_temporal_features_batch(
+        self,
+        timestamps: List[Optional[datetime]]
+    ) -> List[Optional[Dict[str, Any]]]:
+        """
+        Temporal features for a column of timestamps
+        
+        Events in a batch mostly share a handful of hours, so this goes
+        through the per-hour cache rather than a vectorized kernel, which
+        would still have to build one dict per row. Features are resolved
+        inline from one integer hour key; runs of events in the same hour
+        (the common case) reuse the previous lookup and only copy it.
+        
+        Args:
+            timestamps: Naive UTC event timestamps (None where missing)
+        
+        Returns:
+            Temporal feature dicts, None where the timestamp is missing
+        """
+        cache_get = self._temporal_cache.get
+        extract = self._extract_temporal_features
+        features: List[Optional[Dict[str, Any]]] = []
+        append = features.append
+        
+        last_key = None
+        last: Optional[Dict[str, Any]] = None
+        
+        for ts in timestamps:
+            if ts is None:
+                append(None)
+                continue
             
-            if source_type not in self.source_mappers:
-                raise NormalizationError(f"Unknown source type: {source_type}")
-            
-            # Get source-specific mapper
-            mapper = self.source_mappers[source_type]
-            
-            # Normalize
-            normalized = await mapper(raw_event)
-            
-            # Add processing timestamp
-            normalized["processing_timestamp"] = datetime.utcnow()
+            key = ts.toordinal() * 24 + ts.hour
+            if key != last_key:
+                last = cache_get(key)
+                if last is None:
+                    extract(ts)  # computes and caches this hour
+                    last = cache_get(key)
+                last_key = key
             
-            return normalized
+            # Each event gets its own dict
+            append(last.copy())
         
-        except Exception as e:
-            logger.error(f"Normalization error: {e}", exc_info=True)
-            raise NormalizationError(f"Failed to normalize event: {str(e)}")
+        return features
     
     # ===== AZURE AD NORMALIZATION =====
     
-    async def normalize_azure_ad(self, event: Dict[str, Any]) -> Dict[str, Any]:
+    def normalize_azure_ad(self, event: Dict[str, Any]) -> Dict[str, Any]:
         """
         Normalize Azure AD sign-in event to unified schema
         
@@ -96,91 +424,137 @@ class EventNormalizer:
             Normalized event dictionary
         """
         try:
-            # Extract location
-            location_data = event.get("location", {})
-            location = LocationContext(
-                city=location_data.get("city"),
-                country=location_data.get("countryOrRegion"),
-                latitude=location_data.get("geoCoordinates", {}).get("latitude"),
-                longitude=location_data.get("geoCoordinates", {}).get("longitude")
-            ) if location_data else None
-            
-            # Extract device info
-            device_data = event.get("deviceDetail", {})
-            device = DeviceFingerprint(
-                device_id=device_data.get("deviceId"),
-                os=device_data.get("operatingSystem"),
-                browser=device_data.get("browser"),
-                is_mobile=device_data.get("operatingSystem", "").lower() in ["ios", "android"]
-            ) if device_data else None
+            timestamp = self._parse_timestamp(event.get("createdDateTime"))
+            temporal = self._extract_temporal_features(timestamp) if timestamp else None
             
-            # Extract resource
-            resource = ResourceContext(
-                type="application",
-                id=event.get("appId"),
-                name=event.get("appDisplayName")
+            return self._build_azure_ad(
+                event,
+                timestamp,
+                temporal,
+                self._parse_timestamp(event.get("ingestion_timestamp"))
             )
+        
+        except _EVENT_ERRORS as e:
+            self._failure_log.warning(("azure_ad", type(e)), f"Error normalizing Azure AD event: {e}")
+            raise NormalizationError(f"Azure AD normalization failed: {str(e)}")
+    
+    def _build_azure_ad(
+        self,
+        event: Dict[str, Any],
+        timestamp: Optional[datetime],
+        temporal: Optional[Dict[str, Any]],
+        ingestion_timestamp: Optional[datetime]
+    ) -> Dict[str, Any]:
+        """
+        Build normalized Azure AD event from pre-parsed timestamps
+        
+        Shared by the per-event and batch normalization paths.
+        """
+        get = event.get
+        
+        # Nested contexts are built as plain dicts with every field of the
+        # LocationContext/DeviceFingerprint/ResourceContext models (defaults
+        # included); the processor validates whole events against
+        # UnifiedEvent once per batch (find_invalid_events), not per context
+        # here.
+        
+        # Extract location
+        location_data = get("location") or {}
+        location_get = location_data.get
+        coordinates = location_get("geoCoordinates", {})
+        location = {
+            "city": location_get("city"),
+            "country": location_get("countryOrRegion"),
+            "country_code": None,
+            "latitude": coordinates.get("latitude"),
+            "longitude": coordinates.get("longitude"),
+            "timezone": None
+        } if location_data else None
+        
+        # Extract device info
+        device_data = get("deviceDetail") or {}
+        device_get = device_data.get
+        operating_system = device_get("operatingSystem")
+        device = {
+            "device_id": device_get("deviceId"),
+            "device_type": None,
+            "os": operating_system,
+            "os_version": None,
+            "browser": device_get("browser"),
+            "browser_version": None,
+            "is_mobile": (operating_system or "").lower() in _MOBILE_OS_NAMES,
+            "is_bot": False
+        } if device_data else None
+        
+        # Extract resource
+        resource = {
+            "type": "application",
+            "id": get("appId"),
+            "name": get("appDisplayName"),
+            "sensitivity_level": 1,
+            "service": None,
+            "endpoint": None,
+            "method": None,
+            "arn": None
+        }
+        
+        # Determine success
+        status = get("status", {})
+        error_code = status.get("errorCode")
+        success = error_code is None or error_code == 0
+        
+        correlation_id = get("correlationId")
+        risk_detail = get("riskDetail")
+        risk_level = get("riskLevelDuringSignIn")  # Also "hidden", "unknownFutureValue"
+        
+        # Build normalized event
+        normalized = {
+            # Core identity
+            "entity_id": get("userPrincipalName") or get("userId"),
+            "entity_type": _ENTITY_USER,
+            "session_id": correlation_id,
             
-            # Determine success
-            status = event.get("status", {})
-            success = status.get("errorCode") == 0 or status.get("errorCode") is None
+            # Event metadata
+            "event_type": _EVENT_AUTHENTICATION,
+            "event_subtype": "sign_in",
+            "timestamp": timestamp,
+            "success": success,
+            "error_code": str(error_code) if not success else None,
+            "error_message": status.get("failureReason") if not success else None,
             
-            # Extract temporal features
-            timestamp = self._parse_timestamp(event.get("createdDateTime"))
-            temporal = self._extract_temporal_features(timestamp) if timestamp else None
+            # Network context
+            "source_ip": get("ipAddress"),
+            "user_agent": get("clientAppUsed"),
             
-            # Build normalized event
-            normalized = {
-                # Core identity
-                "entity_id": event.get("userPrincipalName") or event.get("userId"),
-                "entity_type": EntityType.USER,
-                "session_id": event.get("correlationId"),
-                
-                # Event metadata
-                "event_type": EventType.AUTHENTICATION,
-                "event_subtype": "sign_in",
-                "timestamp": timestamp,
-                "success": success,
-                "error_code": str(status.get("errorCode")) if not success else None,
-                "error_message": status.get("failureReason") if not success else None,
-                
-                # Network context
-                "source_ip": event.get("ipAddress"),
-                "user_agent": event.get("clientAppUsed"),
-                
-                # Enriched context
-                "location": location.dict() if location else None,
-                "device": device.dict() if device else None,
-                "resource": resource.dict(),
-                "temporal": temporal.dict() if temporal else None,
-                
-                # Risk indicators (from Azure AD)
-                "risk_level": event.get("riskLevelDuringSignIn"),
-                "risk_factors": [event.get("riskDetail")] if event.get("riskDetail") else None,
-                
-                # Metadata
-                "source_system": "azure_ad",
-                "ingestion_timestamp": self._parse_timestamp(event.get("ingestion_timestamp")),
-                "raw_event_id": event.get("id"),
-                "pipeline_version": "1.0.0",
-                
-                # Preserve source-specific fields
-                "source_specific": {
-                    "correlationId": event.get("correlationId"),
-                    "riskState": event.get("riskState"),
-                    "riskLevelAggregated": event.get("riskLevelAggregated")
-                }
-            }
+            # Enriched context
+            "location": location,
+            "device": device,
+            "resource": resource,
+            "temporal": temporal,
+            
+            # Risk indicators (from Azure AD)
+            "risk_level": risk_level if risk_level in _RISK_LEVELS else None,
+            "risk_factors": [risk_detail] if risk_detail else None,
+            
+            # Metadata
+            "source_system": "azure_ad",
+            "ingestion_timestamp": ingestion_timestamp,
+            "raw_event_id": get("id"),
+            "pipeline_version": "1.0.0",
             
-            return normalized
+            # Preserve source-specific fields
+            "source_specific": {
+                "correlationId": correlation_id,
+                "riskState": get("riskState"),
+                "riskLevelAggregated": get("riskLevelAggregated")
+            }
+        }
         
-        except Exception as e:
-            logger.error(f"Error normalizing Azure AD event: {e}")
-            raise NormalizationError(f"Azure AD normalization failed: {str(e)}")
+        return normalized
     
     # ===== CLOUDTRAIL NORMALIZATION =====
     
-    async def normalize_cloudtrail(self, event: Dict[str, Any]) -> Dict[str, Any]:
+    def normalize_cloudtrail(self, event: Dict[str, Any]) -> Dict[str, Any]:
         """
         Normalize AWS CloudTrail event to unified schema
         
@@ -191,85 +565,111 @@ class EventNormalizer:
             Normalized event dictionary
         """
         try:
-            # Extract user identity
-            user_identity = event.get("userIdentity", {})
-            entity_id = self._extract_cloudtrail_entity_id(user_identity)
-            entity_type = self._determine_entity_type(user_identity)
+            timestamp = self._parse_timestamp(event.get("eventTime"))
+            temporal = self._extract_temporal_features(timestamp) if timestamp else None
             
-            # Extract resource
-            service = event.get("eventSource", "").replace(".amazonaws.com", "")
-            resource = ResourceContext(
-                type="cloud_resource",
-                service=service,
-                method=event.get("eventName"),
-                name=event.get("eventName"),
-                # Extract ARN if available
-                id=event.get("resources", [{}])[0].get("ARN") if event.get("resources") else None
+            return self._build_cloudtrail(
+                event,
+                timestamp,
+                temporal,
+                self._parse_timestamp(event.get("ingestion_timestamp"))
             )
+        
+        except _EVENT_ERRORS as e:
+            self._failure_log.warning(("cloudtrail", type(e)), f"Error normalizing CloudTrail event: {e}")
+            raise NormalizationError(f"CloudTrail normalization failed: {str(e)}")
+    
+    def _build_cloudtrail(
+        self,
+        event: Dict[str, Any],
+        timestamp: Optional[datetime],
+        temporal: Optional[Dict[str, Any]],
+        ingestion_timestamp: Optional[datetime]
+    ) -> Dict[str, Any]:
+        """
+        Build normalized CloudTrail event from pre-parsed timestamps
+        
+        Shared by the per-event and batch normalization paths.
+        """
+        get = event.get
+        
+        # Extract user identity
+        user_identity = get("userIdentity", {})
+        entity_id = self._extract_cloudtrail_entity_id(user_identity)
+        entity_type = self._determine_entity_type(user_identity)
+        
+        # Extract resource
+        service = get("eventSource", "").replace(".amazonaws.com", "")
+        event_name = get("eventName")
+        resources = get("resources")
+        resource = {
+            "type": "cloud_resource",
+            # Extract ARN if available
+            "id": resources[0].get("ARN") if resources else None,
+            "name": event_name,
+            "sensitivity_level": 1,
+            "service": service,
+            "endpoint": None,
+            "method": event_name,
+            "arn": None
+        }
+        
+        # Determine success
+        error_code = get("errorCode")
+        success = error_code is None
+        
+        # Build normalized event
+        normalized = {
+            # Core identity
+            "entity_id": entity_id,
+            "entity_type": entity_type,
+            "session_id": get("requestID"),
             
-            # Determine success
-            success = event.get("errorCode") is None
+            # Event metadata
+            "event_type": _EVENT_CLOUD_API,
+            "event_subtype": event_name,
+            "timestamp": timestamp,
+            "success": success,
+            "error_code": error_code,
+            "error_message": get("errorMessage"),
             
-            # Extract timestamp
-            timestamp = self._parse_timestamp(event.get("eventTime"))
-            temporal = self._extract_temporal_features(timestamp) if timestamp else None
+            # Network context
+            "source_ip": get("sourceIPAddress"),
+            "user_agent": get("userAgent"),
             
-            # Build normalized event
-            normalized = {
-                # Core identity
-                "entity_id": entity_id,
-                "entity_type": entity_type,
-                "session_id": event.get("requestID"),
-                
-                # Event metadata
-                "event_type": EventType.CLOUD_API,
-                "event_subtype": event.get("eventName"),
-                "timestamp": timestamp,
-                "success": success,
-                "error_code": event.get("errorCode"),
-                "error_message": event.get("errorMessage"),
-                
-                # Network context
-                "source_ip": event.get("sourceIPAddress"),
-                "user_agent": event.get("userAgent"),
-                
-                # Enriched context
-                "location": None,  # Will be enriched by enricher
-                "device": None,
-                "resource": resource.dict(),
-                "temporal": temporal.dict() if temporal else None,
-                
-                # Risk indicators
-                "risk_level": None,  # Will be computed by ML models
-                "risk_factors": None,
-                
-                # Metadata
-                "source_system": "cloudtrail",
-                "ingestion_timestamp": self._parse_timestamp(event.get("ingestion_timestamp")),
-                "raw_event_id": event.get("eventID"),
-                "pipeline_version": "1.0.0",
-                
-                # Preserve source-specific fields
-                "source_specific": {
-                    "eventVersion": event.get("eventVersion"),
-                    "awsRegion": event.get("awsRegion"),
-                    "accountId": event.get("recipientAccountId"),
-                    "eventType": event.get("eventType"),
-                    "userIdentity": user_identity,
-                    "requestParameters": event.get("requestParameters"),
-                    "responseElements": event.get("responseElements")
-                }
-            }
+            # Enriched context
+            "location": None,  # Will be enriched by enricher
+            "device": None,
+            "resource": resource,
+            "temporal": temporal,
+            
+            # Risk indicators
+            "risk_level": None,  # Will be computed by ML models
+            "risk_factors": None,
             
-            return normalized
+            # Metadata
+            "source_system": "cloudtrail",
+            "ingestion_timestamp": ingestion_timestamp,
+            "raw_event_id": get("eventID"),
+            "pipeline_version": "1.0.0",
+            
+            # Preserve source-specific fields
+            "source_specific": {
+                "eventVersion": get("eventVersion"),
+                "awsRegion": get("awsRegion"),
+                "accountId": get("recipientAccountId"),
+                "eventType": get("eventType"),
+                "userIdentity": user_identity,
+                "requestParameters": get("requestParameters"),
+                "responseElements": get("responseElements")
+            }
+        }
         
-        except Exception as e:
-            logger.error(f"Error normalizing CloudTrail event: {e}")
-            raise NormalizationError(f"CloudTrail normalization failed: {str(e)}")
+        return normalized
     
     # ===== API GATEWAY NORMALIZATION =====
     
-    async def normalize_api_gateway(self, event: Dict[str, Any]) -> Dict[str, Any]:
+    def normalize_api_gateway(self, event: Dict[str, Any]) -> Dict[str, Any]:
         """
         Normalize API Gateway log to unified schema
         
@@ -280,81 +680,108 @@ class EventNormalizer:
             Normalized event dictionary
         """
         try:
-            # Determine entity type based on user_id format
-            user_id = event.get("user_id", "")
-            entity_type = EntityType.USER if "@" in user_id else EntityType.SERVICE
+            timestamp = self._parse_timestamp(event.get("timestamp"))
+            temporal = self._extract_temporal_features(timestamp) if timestamp else None
             
-            # Extract resource
-            resource = ResourceContext(
-                type="api_endpoint",
-                endpoint=event.get("endpoint"),
-                method=event.get("method"),
-                name=f"{event.get('method')} {event.get('endpoint')}"
+            return self._build_api_gateway(
+                event,
+                timestamp,
+                temporal,
+                self._parse_timestamp(event.get("ingestion_timestamp"))
             )
+        
+        except _EVENT_ERRORS as e:
+            self._failure_log.warning(("api_gateway", type(e)), f"Error normalizing API Gateway event: {e}")
+            raise NormalizationError(f"API Gateway normalization failed: {str(e)}")
+    
+    def _build_api_gateway(
+        self,
+        event: Dict[str, Any],
+        timestamp: Optional[datetime],
+        temporal: Optional[Dict[str, Any]],
+        ingestion_timestamp: Optional[datetime]
+    ) -> Dict[str, Any]:
+        """
+        Build normalized API Gateway event from pre-parsed timestamps
+        
+        Shared by the per-event and batch normalization paths.
+        """
+        get = event.get
+        
+        # Determine entity type based on user_id format
+        user_id = get("user_id", "")
+        entity_type = _ENTITY_USER if "@" in user_id else _ENTITY_SERVICE
+        
+        # Extract resource
+        method = get("method")
+        endpoint = get("endpoint")
+        request_id = get("request_id")
+        resource = {
+            "type": "api_endpoint",
+            "id": None,
+            "name": f"{method} {endpoint}",
+            "sensitivity_level": 1,
+            "service": None,
+            "endpoint": endpoint,
+            "method": method,
+            "arn": None
+        }
+        
+        # Determine success
+        status_code = get("status_code", 0)
+        success = 200 <= status_code < 300
+        
+        # Extract performance metrics
+        performance = {
+            "latency_ms": get("latency_ms"),
+            "request_size_bytes": get("request_size_bytes"),
+            "response_size_bytes": get("response_size_bytes")
+        }
+        
+        # Build normalized event
+        normalized = {
+            # Core identity
+            "entity_id": user_id,
+            "entity_type": entity_type,
+            "session_id": request_id,
             
-            # Determine success
-            status_code = event.get("status_code", 0)
-            success = 200 <= status_code < 300
+            # Event metadata
+            "event_type": _EVENT_API_CALL,
+            "event_subtype": method,
+            "timestamp": timestamp,
+            "success": success,
+            "error_code": str(status_code) if not success else None,
+            "error_message": None,
             
-            # Extract timestamp
-            timestamp = self._parse_timestamp(event.get("timestamp"))
-            temporal = self._extract_temporal_features(timestamp) if timestamp else None
+            # Network context
+            "source_ip": get("source_ip"),
+            "user_agent": get("user_agent"),
             
-            # Extract performance metrics
-            performance = {
-                "latency_ms": event.get("latency_ms"),
-                "request_size_bytes": event.get("request_size_bytes"),
-                "response_size_bytes": event.get("response_size_bytes")
-            }
+            # Enriched context
+            "location": None,  # Will be enriched
+            "device": None,
+            "resource": resource,
+            "temporal": temporal,
+            "performance": performance,
             
-            # Build normalized event
-            normalized = {
-                # Core identity
-                "entity_id": user_id,
-                "entity_type": entity_type,
-                "session_id": event.get("request_id"),
-                
-                # Event metadata
-                "event_type": EventType.API_CALL,
-                "event_subtype": event.get("method"),
-                "timestamp": timestamp,
-                "success": success,
-                "error_code": str(status_code) if not success else None,
-                "error_message": None,
-                
-                # Network context
-                "source_ip": event.get("source_ip"),
-                "user_agent": event.get("user_agent"),
-                
-                # Enriched context
-                "location": None,  # Will be enriched
-                "device": None,
-                "resource": resource.dict(),
-                "temporal": temporal.dict() if temporal else None,
-                "performance": performance,
-                
-                # Risk indicators
-                "risk_level": None,
-                "risk_factors": None,
-                
-                # Metadata
-                "source_system": "api_gateway",
-                "ingestion_timestamp": self._parse_timestamp(event.get("ingestion_timestamp")),
-                "raw_event_id": event.get("request_id"),
-                "pipeline_version": "1.0.0",
-                
-                # Preserve source-specific fields
-                "source_specific": {
-                    "api_key_id": event.get("api_key_id"),
-                    "status_code": status_code
-                }
-            }
+            # Risk indicators
+            "risk_level": None,
+            "risk_factors": None,
             
-            return normalized
+            # Metadata
+            "source_system": "api_gateway",
+            "ingestion_timestamp": ingestion_timestamp,
+            "raw_event_id": request_id,
+            "pipeline_version": "1.0.0",
+            
+            # Preserve source-specific fields
+            "source_specific": {
+                "api_key_id": get("api_key_id"),
+                "status_code": status_code
+            }
+        }
         
-        except Exception as e:
-            logger.error(f"Error normalizing API Gateway event: {e}")
-            raise NormalizationError(f"API Gateway normalization failed: {str(e)}")
+        return normalized
     
     # ===== HELPER METHODS =====
     
@@ -371,16 +798,10 @@ class EventNormalizer:
         else:
             return "unknown"
     
-    def _determine_entity_type(self, user_identity: Dict) -> EntityType:
+    def _determine_entity_type(self, user_identity: Dict) -> str:
         """Determine entity type from CloudTrail userIdentity"""
         identity_type = user_identity.get("type", "").lower()
-        
-        if identity_type in ["assumedrole", "awsservice", "federated"]:
-            return EntityType.SERVICE
-        elif identity_type in ["iamuser", "root"]:
-            return EntityType.USER
-        else:
-            return EntityType.UNKNOWN
+        return _IDENTITY_ENTITY_TYPES.get(identity_type, _ENTITY_UNKNOWN)
     
     def _parse_timestamp(self, timestamp_str: Optional[str]) -> Optional[datetime]:
         """
@@ -389,27 +810,21 @@ class EventNormalizer:
         Supports multiple formats:
         - ISO 8601: 2025-01-08T10:00:00Z
         - ISO 8601 with microseconds: 2025-01-08T10:00:00.123456Z
+        - Explicit offsets (2025-01-08T10:00:00-05:00), converted to naive UTC
         """
         if not timestamp_str:
             return None
         
-        try:
-            # Remove 'Z' suffix if present
-            if timestamp_str.endswith('Z'):
-                timestamp_str = timestamp_str[:-1]
-            
-            # Try parsing with microseconds
-            try:
-                return datetime.fromisoformat(timestamp_str)
-            except:
-                # Try parsing without microseconds
-                return datetime.strptime(timestamp_str, "%Y-%m-%dT%H:%M:%S")
-        
-        except Exception as e:
-            logger.warning(f"Failed to parse timestamp '{timestamp_str}': {e}")
-            return None
+        # Same parser as the batch path: explicit offsets become naive UTC
+        parsed = _parse_iso_utc(timestamp_str)
+        if parsed is None:
+            self._failure_log.warning(
+                ("timestamp", ValueError),
+                f"Failed to parse timestamp '{timestamp_str}'"
+            )
+        return parsed
     
-    def _extract_temporal_features(self, timestamp: datetime) -> TemporalContext:
+    def _extract_temporal_features(self, timestamp: datetime) -> Dict[str, Any]:
         """
         Extract temporal features from timestamp
         
@@ -417,26 +832,34 @@ class EventNormalizer:
             timestamp: Event timestamp
         
         Returns:
-            TemporalContext object
+            Temporal feature dictionary (TemporalContext fields)
         """
         hour = timestamp.hour
-        day_of_week = timestamp.weekday()  # 0=Monday, 6=Sunday
-        is_weekend = day_of_week >= 5
-        is_business_hours = 9 <= hour < 17
-        
-        return TemporalContext(
-            hour_of_day=hour,
-            day_of_week=day_of_week,
-            is_weekend=is_weekend,
-            is_business_hours=is_business_hours,
-            week_of_year=timestamp.isocalendar()[1],
-            month=timestamp.month
-        )
+        key = timestamp.toordinal() * 24 + hour
+        
+        cached = self._temporal_cache.get(key)
+        if cached is None:
+            day_of_week = timestamp.weekday()  # 0=Monday, 6=Sunday
+            cached = {
+                "hour_of_day": hour,
+                "day_of_week": day_of_week,
+                "is_weekend": day_of_week >= 5,
+                "is_business_hours": 9 <= hour < 17,
+                "week_of_year": timestamp.isocalendar()[1],
+                "month": timestamp.month
+            }
+            
+            if len(self._temporal_cache) >= _TEMPORAL_CACHE_SIZE:
+                self._temporal_cache.clear()
+            self._temporal_cache[key] = cached
+        
+        # Each event gets its own dict
+        return dict(cached)
 
 
 # ===== TESTING =====
 
-async def test_normalizer():
+def test_normalizer():
     """Test normalizer with sample events"""
     print("Testing Event Normalizer...")
     
@@ -471,7 +894,7 @@ async def test_normalizer():
     }
     
     try:
-        normalized = await normalizer.normalize(azure_event)
+        normalized = normalizer.normalize(azure_event)
         print(f"   Normalized Azure AD event")
         print(f"   Entity: {normalized['entity_id']}")
         print(f"   Event Type: {normalized['event_type']}")
@@ -504,7 +927,7 @@ async def test_normalizer():
     }
     
     try:
-        normalized = await normalizer.normalize(cloudtrail_event)
+        normalized = normalizer.normalize(cloudtrail_event)
         print(f"   Normalized CloudTrail event")
         print(f"   Entity: {normalized['entity_id']}")
         print(f"   Event Type: {normalized['event_type']}")
@@ -532,7 +955,7 @@ async def test_normalizer():
     }
     
     try:
-        normalized = await normalizer.normalize(api_event)
+        normalized = normalizer.normalize(api_event)
         print(f"   Normalized API Gateway event")
         print(f"   Entity: {normalized['entity_id']}")
         print(f"   Entity Type: {normalized['entity_type']}")
@@ -544,5 +967,4 @@ async def test_normalizer():
 
 
 if __name__ == "__main__":
-    import asyncio
-    asyncio.run(test_normalizer())
\ No newline at end of file
+    test_normalizer()
\ No newline at end of file
@@ -4,9 +4,14 @@ Unified Event Schema for ZTBF
 
 """
 
+import functools
+import hashlib
+import socket
 from datetime import datetime
-from typing import Optional, Dict, List, Literal
-from pydantic import BaseModel, Field, validator
+from typing import Optional, Dict, List, Literal, Union
+from typing_extensions import Annotated
+import pyarrow as pa
+from pydantic import BaseModel, BeforeValidator, ConfigDict, Field, TypeAdapter, ValidationError
 from enum import Enum
 
 
@@ -37,6 +42,86 @@ class RiskLevel(str, Enum):
     CRITICAL = "critical"
 
 
+def _enum_value(value: Union[str, Enum, None]) -> Optional[str]:
+    """Plain string value of an enum member (strings pass through)"""
+    return value.value if isinstance(value, Enum) else value
+
+
+# Literal value types for UnifiedEvent fields. Pydantic validates a
+# Literal about twice as fast as an Enum, and the Enum classes stay as
+# named constants. Members such as EntityType.USER are converted to
+# their value first, so a validated event always holds plain strings
+# (they still compare equal to the members).
+EntityTypeValue = Annotated[
+    Literal["user", "service", "device", "unknown"],
+    BeforeValidator(_enum_value)
+]
+EventTypeValue = Annotated[
+    Literal[
+        "authentication", "authorization", "api_call", "cloud_api",
+        "data_access", "network_connection", "admin_action"
+    ],
+    BeforeValidator(_enum_value)
+]
+RiskLevelValue = Annotated[
+    Literal["none", "low", "medium", "high", "critical"],
+    BeforeValidator(_enum_value)
+]
+
+
+# ===== STABLE HASHING =====
+
+# Fixed key so feature hashes agree across processes and runs
+# (builtin hash() is salted per interpreter via PYTHONHASHSEED)
+_FEATURE_HASH_KEY = b"ztbf-features-v1"
+
+
+@functools.lru_cache(maxsize=1 << 16)
+def _stable_hash(value: str) -> int:
+    """
+    Deterministic signed 64-bit hash of a string
+    
+    Args:
+        value: String to hash
+        
+    Returns:
+        Hash that fits an int64 column
+    """
+    digest = hashlib.blake2b(value.encode(), digest_size=8, key=_FEATURE_HASH_KEY).digest()
+    return int.from_bytes(digest, "little", signed=True)
+
+
+# ===== IP ANONYMIZATION =====
+
+@functools.lru_cache(maxsize=1 << 16)
+def _anonymize_ip(ip: str) -> Optional[str]:
+    """
+    Mask the host part of an IP address
+    
+    IPv4 keeps the first three octets (last one becomes XXX); IPv6 keeps
+    the /64 network prefix. Addresses are parsed with inet_pton, so
+    malformed input is rejected rather than masked. Source IPs repeat
+    heavily in security logs, so results are memoized.
+    
+    Args:
+        ip: Source IP address
+    
+    Returns:
+        Anonymized address, or None if ip is not a valid IP address
+    """
+    try:
+        if ":" in ip:
+            packed = socket.inet_pton(socket.AF_INET6, ip)
+            return socket.inet_ntop(socket.AF_INET6, packed[:8] + bytes(8))
+        socket.inet_pton(socket.AF_INET, ip)
+    except (OSError, ValueError):
+        return None
+    return ip[:ip.rfind(".") + 1] + "XXX"
+
+
+# Leaf contexts are frozen models: instances passed into UnifiedEvent
+# are never revalidated or copied, and can be shared between events.
+
 class LocationContext(BaseModel):
     """Geographic location information"""
     city: Optional[str] = None
@@ -46,8 +131,7 @@ class LocationContext(BaseModel):
     longitude: Optional[float] = None
     timezone: Optional[str] = None
     
-    class Config:
-        extra = "forbid"
+    model_config = ConfigDict(extra="forbid", frozen=True)
 
 class DeviceFingerprint(BaseModel):
     """Device identification information"""
@@ -60,8 +144,7 @@ class DeviceFingerprint(BaseModel):
     is_mobile: bool = False
     is_bot: bool = False
     
-    class Config:
-        extra = "forbid"
+    model_config = ConfigDict(extra="forbid", frozen=True)
 
 class ResourceContext(BaseModel):
     """Information about the resource being accessed"""
@@ -76,8 +159,7 @@ class ResourceContext(BaseModel):
     method: Optional[str] = None  # For API resources (e.g., "GET", "POST")
     arn: Optional[str] = None  # For AWS resources
     
-    class Config:
-        extra = "allow"  # Allow source-specific fields
+    model_config = ConfigDict(extra="allow", frozen=True)  # Allow source-specific fields
 
 class EntityMetadata(BaseModel):
     """Metadata about the entity (user/service)"""
@@ -90,8 +172,7 @@ class EntityMetadata(BaseModel):
     account_creation_date: Optional[datetime] = None
     last_password_change: Optional[datetime] = None
     
-    class Config:
-        extra = "allow"
+    model_config = ConfigDict(extra="allow", frozen=True)
 
 class TemporalContext(BaseModel):
     """Temporal features extracted from timestamp"""
@@ -102,8 +183,7 @@ class TemporalContext(BaseModel):
     week_of_year: int = Field(..., ge=1, le=53)
     month: int = Field(..., ge=1, le=12)
     
-    class Config:
-        extra = "forbid"
+    model_config = ConfigDict(extra="forbid", frozen=True)
 
 
 class PerformanceMetrics(BaseModel):
@@ -114,8 +194,7 @@ class PerformanceMetrics(BaseModel):
     cpu_usage_percent: Optional[float] = None
     memory_usage_mb: Optional[float] = None
     
-    class Config:
-        extra = "forbid"
+    model_config = ConfigDict(extra="forbid", frozen=True)
 
 class UnifiedEvent(BaseModel):
     """
@@ -127,11 +206,11 @@ class UnifiedEvent(BaseModel):
     
     # ===== CORE IDENTITY =====
     entity_id: str = Field(..., description="Unique identifier for the entity (user/service)")
-    entity_type: EntityType = Field(..., description="Type of entity")
+    entity_type: EntityTypeValue = Field(..., description="Type of entity")
     session_id: Optional[str] = Field(None, description="Session or correlation ID")
     
     # ===== EVENT METADATA =====
-    event_type: EventType = Field(..., description="High-level event category")
+    event_type: EventTypeValue = Field(..., description="High-level event category")
     event_subtype: str = Field(..., description="Specific event action (e.g., 'sign_in', 'AssumeRole')")
     timestamp: datetime = Field(..., description="Event occurrence time (UTC)")
     success: bool = Field(..., description="Whether the action succeeded")
@@ -140,7 +219,6 @@ class UnifiedEvent(BaseModel):
     
     # ===== NETWORK CONTEXT =====
     source_ip: str = Field(..., description="Source IP address")
-    source_ip_anonymized: Optional[str] = Field(None, description="Anonymized IP (last octet masked)")
     user_agent: Optional[str] = Field(None, description="User agent string")
     
     # ===== ENRICHED CONTEXT =====
@@ -152,7 +230,7 @@ class UnifiedEvent(BaseModel):
     performance: Optional[PerformanceMetrics] = Field(None, description="Performance metrics")
     
     # ===== RISK INDICATORS =====
-    risk_level: Optional[RiskLevel] = Field(None, description="Pre-computed risk level (if available)")
+    risk_level: Optional[RiskLevelValue] = Field(None, description="Pre-computed risk level (if available)")
     risk_score: Optional[float] = Field(None, ge=0, le=100, description="Risk score 0-100")
     risk_factors: Optional[List[str]] = Field(None, description="List of risk factors identified")
     
@@ -167,22 +245,19 @@ class UnifiedEvent(BaseModel):
     # These are preserved for debugging and compliance
     source_specific: Optional[Dict] = Field(None, description="Source-specific fields")
 
-    class Config:
-        extra = "forbid"
-        json_encoders = {
-            datetime: lambda v: v.isoformat()
-        }
+    # Native v2 config: validation runs in pydantic-core and datetimes
+    # already serialize to ISO 8601 in JSON mode
+    model_config = ConfigDict(extra="forbid")
     
-    @validator("source_ip_anonymized", always=True)
-    def anonymize_ip(cls, v, values):
-        """Automatically anonymize IP address"""
-        if v is None and "source_ip" in values:
-            ip = values["source_ip"]
-            parts = ip.split(".")
-            if len(parts) == 4:
-                # Mask last octet
-                return f"{parts[0]}.{parts[1]}.{parts[2]}.XXX"
-        return v
+    @functools.cached_property
+    def source_ip_anonymized(self) -> Optional[str]:
+        """
+        Anonymized IP (IPv4 last octet / IPv6 host bits masked)
+        
+        Derived on first access rather than validated on every
+        construction; not part of model_dump() output.
+        """
+        return _anonymize_ip(self.source_ip)
     
     def to_feature_dict(self) -> Dict:
         """
@@ -191,18 +266,18 @@ class UnifiedEvent(BaseModel):
         """
         features = {
             # Identity
-            "entity_id_hash": hash(self.entity_id),  # Anonymized
-            "entity_type": self.entity_type.value,
+            "entity_id_hash": _stable_hash(self.entity_id),  # Anonymized
+            "entity_type": self.entity_type,
             "is_user": self.entity_type == EntityType.USER,
             "is_service": self.entity_type == EntityType.SERVICE,
             
             # Event
-            "event_type": self.event_type.value,
+            "event_type": self.event_type,
             "event_subtype": self.event_subtype,
             "success": self.success,
             
             # Network
-            "source_ip_hash": hash(self.source_ip),  # Anonymized
+            "source_ip_hash": _stable_hash(self.source_ip),  # Anonymized
             
             # Location
             "location_country": self.location.country if self.location else None,
@@ -210,7 +285,7 @@ class UnifiedEvent(BaseModel):
             "location_longitude": self.location.longitude if self.location else None,
             
             # Device
-            "device_id_hash": hash(self.device.device_id) if self.device and self.device.device_id else None,
+            "device_id_hash": _stable_hash(self.device.device_id) if self.device and self.device.device_id else None,
             "device_type": self.device.device_type if self.device else None,
             "device_os": self.device.os if self.device else None,
             "is_mobile": self.device.is_mobile if self.device else False,
@@ -243,6 +318,36 @@ class UnifiedEvent(BaseModel):
         
         return {k: v for k, v in features.items() if v is not None}
 
+# ===== ARROW STORAGE SCHEMA =====
+
+# Arrow types for UnifiedEvent's flat top-level fields as stored in
+# Parquet. Nested contexts and source_specific carry source-dependent
+# keys, so their struct types are inferred from the data. Enum-like
+# columns are dictionary-encoded (int16 codes instead of repeated strings).
+_CATEGORY = pa.dictionary(pa.int16(), pa.string())
+UNIFIED_ARROW_SCHEMA = pa.schema([
+    ("entity_id", pa.string()),
+    ("entity_type", _CATEGORY),
+    ("session_id", pa.string()),
+    ("event_type", _CATEGORY),
+    ("event_subtype", _CATEGORY),
+    ("timestamp", pa.timestamp("us")),
+    ("success", pa.bool_()),
+    ("error_code", pa.string()),
+    ("error_message", pa.string()),
+    ("source_ip", pa.string()),
+    ("user_agent", pa.string()),
+    ("risk_level", _CATEGORY),
+    ("risk_score", pa.float64()),
+    ("risk_factors", pa.list_(pa.string())),
+    ("source_system", _CATEGORY),
+    ("ingestion_timestamp", pa.timestamp("us")),
+    ("processing_timestamp", pa.timestamp("us")),
+    ("raw_event_id", pa.string()),
+    ("pipeline_version", _CATEGORY),
+])
+
+
 # ===== SOURCE-SPECIFIC SCHEMAS =====
 # These are used for ingestion validation before normalization
 
@@ -266,8 +371,7 @@ class AzureADSignInEvent(BaseModel):
     riskDetail: Optional[str] = None
     riskState: Optional[str] = None
     
-    class Config:
-        extra = "allow"  # Azure AD has many optional fields
+    model_config = ConfigDict(extra="allow")  # Azure AD has many optional fields
 
 
 class CloudTrailEvent(BaseModel):
@@ -291,8 +395,7 @@ class CloudTrailEvent(BaseModel):
     errorMessage: Optional[str] = None
     resources: Optional[List[Dict]] = None
     
-    class Config:
-        extra = "allow"
+    model_config = ConfigDict(extra="allow")
 
 
 class APIGatewayLog(BaseModel):
@@ -310,8 +413,7 @@ class APIGatewayLog(BaseModel):
     user_agent: Optional[str] = None
     api_key_id: Optional[str] = None
     
-    class Config:
-        extra = "allow"
+    model_config = ConfigDict(extra="allow")
 
 # ===== SCHEMA VERSION REGISTRY =====
 SCHEMA_VERSION = "1.0.0"
@@ -324,6 +426,14 @@ SCHEMA_REGISTRY = {
 }
 
 
+# One TypeAdapter per schema, built at import (validators are reused and
+# calls skip the model_validate wrapper)
+_ADAPTERS: Dict[str, TypeAdapter] = {
+    name: TypeAdapter(schema_class)
+    for name, schema_class in SCHEMA_REGISTRY.items()
+}
+
+
 def get_schema(schema_name: str) -> BaseModel:
     """Get schema class by name"""
     if schema_name not in SCHEMA_REGISTRY:
@@ -331,7 +441,53 @@ def get_schema(schema_name: str) -> BaseModel:
     return SCHEMA_REGISTRY[schema_name]
 
 
-def validate_event(schema_name: str, event_data: Dict) -> BaseModel:
-    """Validate event against schema"""
-    schema_class = get_schema(schema_name)
-    return schema_class(**event_data)
\ No newline at end of file
+def _get_adapter(schema_name: str) -> TypeAdapter:
+    """Get the prebuilt TypeAdapter for a schema name"""
+    adapter = _ADAPTERS.get(schema_name)
+    if adapter is None:
+        raise ValueError(f"Unknown schema: {schema_name}")
+    return adapter
+
+
+def validate_event(schema_name: str, event_data: Union[Dict, str, bytes]) -> BaseModel:
+    """
+    Validate event against schema
+    
+    Raw JSON (str/bytes) is parsed and validated in one pydantic-core
+    pass; dicts are validated directly.
+    """
+    adapter = _get_adapter(schema_name)
+    if isinstance(event_data, (str, bytes, bytearray)):
+        return adapter.validate_json(event_data)
+    return adapter.validate_python(event_data)
+
+
+# ===== PIPELINE BOUNDARY =====
+
+# Whole pipeline batches are validated in one pydantic-core call
+_UNIFIED_BATCH_ADAPTER = TypeAdapter(List[UnifiedEvent])
+
+
+def find_invalid_events(events: List[Dict]) -> Dict[int, str]:
+    """
+    Validate pipeline-built event dicts against UnifiedEvent
+    
+    The normalizer builds events (and their nested contexts) as plain
+    dicts; this is where they are validated, once per batch before
+    storage. The dicts themselves are what gets stored.
+    
+    Args:
+        events: Normalized/enriched event dictionaries
+    
+    Returns:
+        Index -> first validation error, for each event that fails
+    """
+    try:
+        _UNIFIED_BATCH_ADAPTER.validate_python(events)
+    except ValidationError as e:
+        invalid: Dict[int, str] = {}
+        for error in e.errors(include_url=False):
+            index, *location = error["loc"]
+            invalid.setdefault(index, f"{'.'.join(map(str, location))}: {error['msg']}")
+        return invalid
+    return {}
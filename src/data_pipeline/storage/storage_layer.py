@@ -5,16 +5,33 @@ Storage Layer for ZTBF Data Pipeline
 
 import os
 import json
+import logging
+import threading
+import time
+import uuid
 from datetime import datetime, timedelta
-from typing import List, Dict, Optional
+from typing import Callable, ClassVar, List, Dict, Optional, Iterator, Set, Tuple
 from pathlib import Path
+from concurrent.futures import ThreadPoolExecutor, wait
+from urllib.parse import urlparse
+import numpy as np
 import pandas as pd
 import pyarrow as pa
+import pyarrow.compute as pc
+import pyarrow.dataset as ds
+import pyarrow.fs as pafs
 import pyarrow.parquet as pq
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 import boto3
 from botocore.client import Config
+from botocore.exceptions import ClientError
 
+from data_pipeline.schemas.unified_schema import UNIFIED_ARROW_SCHEMA
+
+logger = logging.getLogger(__name__)
+
+# botocore logs every credential lookup and retry at INFO
+logging.getLogger('botocore').setLevel(logging.WARNING)
 
 @dataclass
 class StorageConfig:
@@ -26,44 +43,411 @@ class StorageConfig:
     secret_key: str = "minioadmin"
     bucket_name: str = "ztbf-events"
     region: str = "us-east-1"
+    skip_bucket_check: bool = False  # Bucket is provisioned externally (production)
     
     # Storage tiers
     hot_retention_days: int = 7
     warm_retention_days: int = 30
     cold_retention_days: int = 90
+    # Let the bucket expire cold/ objects itself (S3 lifecycle / MinIO ILM)
+    # instead of listing and deleting them. The rule is merged into the
+    # bucket's existing lifecycle rules at startup (also with
+    # skip_bucket_check); if it can't be installed, lifecycle_management
+    # keeps deleting cold data itself.
+    bucket_lifecycle_expiration: bool = False
     
     # Partitioning
     partition_by: List[str] = None
     
     # Compression
-    hot_compression: str = "snappy"
-    warm_compression: str = "snappy"
-    cold_compression: str = "gzip"
+    hot_compression: str = "zstd"
+    warm_compression: str = "zstd"
+    cold_compression: str = "zstd"
+    hot_compression_level: Optional[int] = 1  # Cheap, fast writes
+    warm_compression_level: Optional[int] = 3
+    cold_compression_level: Optional[int] = 9  # Densest, rarely read
+    data_page_size: int = 1 << 20  # 1 MiB Parquet data pages
+    row_group_size: int = 131072  # Rows per row group (min/max stats drive read pruning)
+    
+    # Partition spooling (opt-in): batches for a partition accumulate in one
+    # local Parquet file that is uploaded as a single object, instead of one
+    # small object per batch. Spooled rows are not readable until uploaded
+    # and are lost if the process dies before the file is finished
+    # (at-most-once); call close() on shutdown. Finished files whose upload
+    # fails stay in spool_dir and are retried, also by the next run.
+    # Off: every write_events batch is uploaded before return.
+    spool_partitions: bool = False
+    spool_dir: str = "data/spool"
+    spool_max_bytes: int = 128 << 20  # Upload a partition file at this size
+    spool_idle_seconds: float = 300.0  # Upload partitions not written to for this long
+    spool_check_seconds: float = 30.0  # How often the background timer looks for idle partitions
+    
+    # Uploads / reads
+    upload_workers: int = 16  # Partitions written concurrently per batch
+    read_workers: int = 16  # Parquet files fetched concurrently per read
+    max_pool_connections: int = 64  # boto3 HTTP connection pool size
+    max_retry_attempts: int = 8  # Per request, with client-side rate limiting
     
     def __post_init__(self):
         if self.partition_by is None:
             self.partition_by = ["date", "hour", "source_system"]
 
+
+def _tier_compression(config: StorageConfig) -> Dict[str, Tuple[str, Optional[int]]]:
+    """(compression, level) per tier from a storage config"""
+    return {
+        "hot": (config.hot_compression, config.hot_compression_level),
+        "warm": (config.warm_compression, config.warm_compression_level),
+        "cold": (config.cold_compression, config.cold_compression_level)
+    }
+
+# ===== ARROW BATCH HELPERS =====
+
+# Declared column types; anything else is inferred from the values
+_COLUMN_TYPES = {field.name: field.type for field in UNIFIED_ARROW_SCHEMA}
+
+
+def _column_names(events: List[Dict]) -> List[str]:
+    """Union of keys across events in first-seen order (pd.DataFrame's columns)"""
+    return list(dict.fromkeys(key for event in events for key in event))
+
+
+def _column_array(name: str, values: list) -> pa.Array:
+    """Build one column, using the UNIFIED_ARROW_SCHEMA type when declared"""
+    arrow_type = _COLUMN_TYPES.get(name)
+    if arrow_type is not None:
+        try:
+            return pa.array(values, type=arrow_type)
+        except (pa.ArrowInvalid, pa.ArrowTypeError):
+            pass  # e.g. raw timestamp strings - fall back to inference
+    return pa.array(values)
+
+
+def _events_to_table(events: List[Dict], names: Optional[List[str]] = None) -> pa.Table:
+    """
+    Convert event dicts to an Arrow table without going through pandas
+    
+    Declared columns get fixed types, so e.g. an all-null error_message
+    is still written as a string column rather than Arrow's null type.
+    
+    Args:
+        events: Event dictionaries
+        names: Columns to build (default: union of the events' keys);
+               missing values become nulls
+    """
+    if names is None:
+        names = _column_names(events)
+    return pa.Table.from_pydict({
+        name: _column_array(name, [event.get(name) for event in events])
+        for name in names
+    })
+
+
+def _same_layout(source: pa.DataType, target: pa.DataType) -> bool:
+    """Whether two types have the same nested field names (casting a struct
+    onto one with fewer fields would silently drop data)"""
+    if pa.types.is_struct(source) or pa.types.is_struct(target):
+        return (
+            pa.types.is_struct(source) and pa.types.is_struct(target)
+            and [f.name for f in source] == [f.name for f in target]
+            and all(_same_layout(f.type, g.type) for f, g in zip(source, target))
+        )
+    if pa.types.is_list(source) and pa.types.is_list(target):
+        return _same_layout(source.value_type, target.value_type)
+    return True
+
+
+def _conform_to_schema(table: pa.Table, schema: pa.Schema) -> Optional[pa.Table]:
+    """
+    Cast a table to an existing file's schema, or None if it can't be
+    
+    Batches of one partition usually agree except for inferred types
+    (e.g. an all-null nested field). Columns the table lacks are filled
+    with nulls; extra columns or differing nested fields can't be
+    written to the same Parquet file without losing data.
+    """
+    if table.schema == schema:
+        return table
+    if not set(table.column_names) <= set(schema.names):
+        return None
+    
+    columns = []
+    for target in schema:
+        index = table.schema.get_field_index(target.name)
+        if index < 0:
+            columns.append(pa.nulls(table.num_rows, target.type))
+            continue
+        column = table.column(index)
+        if column.type != target.type:
+            if not _same_layout(column.type, target.type):
+                return None
+            try:
+                column = column.cast(target.type)
+            except (pa.ArrowInvalid, pa.ArrowNotImplementedError, pa.ArrowTypeError):
+                return None
+        columns.append(column)
+    return pa.Table.from_arrays(columns, schema=schema)
+
+
+def _widen_schema(schema: pa.Schema, other: pa.Schema) -> Optional[pa.Schema]:
+    """Schema both can be cast to (null -> typed, missing columns), or None"""
+    try:
+        return pa.unify_schemas([schema, other], promote_options="permissive")
+    except (pa.ArrowInvalid, pa.ArrowTypeError):
+        return None
+
+
+def _concat_tables(tables: List[pa.Table]) -> pa.Table:
+    """
+    Concatenate tables read from different files
+    
+    Files can differ in schema (each source's source_specific struct, or
+    string vs dictionary columns across writer versions); structs and
+    nulls are unified permissively, and dictionary columns are decoded
+    when they clash with plain ones.
+    """
+    if len(tables) == 1:
+        return tables[0]
+    try:
+        return pa.concat_tables(tables, promote_options="permissive")
+    except (pa.ArrowInvalid, pa.ArrowTypeError):
+        return pa.concat_tables(
+            [_decode_dictionaries(table) for table in tables],
+            promote_options="permissive"
+        )
+
+
+def _decode_dictionaries(table: pa.Table) -> pa.Table:
+    """Cast dictionary-encoded columns to their value type"""
+    for index, field in enumerate(table.schema):
+        if pa.types.is_dictionary(field.type):
+            table = table.set_column(
+                index, field.name, table.column(index).cast(field.type.value_type)
+            )
+    return table
+
+
+def _group_by_source(events: List[Dict]) -> Dict[str, List[Dict]]:
+    """Group events by source_system (events without one are dropped)"""
+    by_source: Dict[str, List[Dict]] = {}
+    for event in events:
+        source = event.get("source_system")
+        if source is not None:
+            by_source.setdefault(source, []).append(event)
+    return by_source
+
+
+def _split_by_source(table: pa.Table) -> Iterator[Tuple[str, pa.Table]]:
+    """Split a table by source_system (rows without one are dropped)"""
+    sources = table.column("source_system")
+    for source in pc.unique(sources).to_pylist():
+        if source is not None:
+            yield source, table.filter(pc.equal(sources, source))
+
+
+def _split_by_hour(table: pa.Table) -> Iterator[Tuple[Tuple[str, int], pa.Table]]:
+    """
+    Split a table into (date, hour) partitions of its timestamp column
+    
+    Partition keys are computed with Arrow kernels and rows are grouped
+    with one stable argsort and sliced out by offset (row order within a
+    partition is kept). Each
+    partition gets constant date (string) and hour (int32) columns, and
+    rows without a timestamp are dropped, matching the previous pandas
+    groupby.
+    
+    Yields:
+        ((date, hour), partition table)
+    """
+    ts = table.column("timestamp")
+    if not pa.types.is_timestamp(ts.type):
+        # Raw strings - parse like the pandas path did
+        ts = pa.chunked_array([pa.array(pd.to_datetime(ts.to_pandas()))])
+        table = table.set_column(table.schema.get_field_index("timestamp"), "timestamp", ts)
+    
+    valid = pc.is_valid(ts)
+    if not pc.all(valid).as_py():
+        table = table.filter(valid)
+        ts = table.column("timestamp")
+    if table.num_rows == 0:
+        return
+    
+    hour_start = pc.floor_temporal(ts, unit="hour")
+    keys = pc.cast(hour_start, pa.int64()).to_numpy()
+    order = np.argsort(keys, kind="stable")
+    bounds = np.flatnonzero(np.diff(keys[order])) + 1
+    
+    # Reorder once (unless the batch is a single hour), then hand out
+    # zero-copy slices
+    if len(bounds):
+        table = table.take(order)
+        hour_start = hour_start.take(order)
+    starts = [0, *bounds.tolist()]
+    ends = [*bounds.tolist(), table.num_rows]
+    
+    for start, end in zip(starts, ends):
+        first = hour_start[start].as_py()
+        date, hour = first.strftime("%Y-%m-%d"), first.hour
+        
+        part = table.slice(start, end - start)
+        part = part.append_column("date", pa.repeat(pa.scalar(date, pa.string()), part.num_rows))
+        part = part.append_column("hour", pa.repeat(pa.scalar(hour, pa.int32()), part.num_rows))
+        yield (date, hour), part
+
+
+def _with_key_columns(columns: Optional[List[str]]) -> Optional[List[str]]:
+    """Add timestamp and source_system to a column projection"""
+    if columns is None:
+        return None
+    return list(columns) + [name for name in ("timestamp", "source_system") if name not in columns]
+
+
+def _read_parquet(
+    path: str,
+    columns: Optional[List[str]] = None,
+    row_filter: Optional[pc.Expression] = None,
+    filesystem: Optional[pafs.FileSystem] = None
+) -> pa.Table:
+    """
+    Read one Parquet file with column projection and predicate pushdown
+    
+    Files in a partition can have different column sets, so requested
+    columns a file doesn't have are skipped rather than raising.
+    """
+    dataset = ds.dataset(path, format="parquet", filesystem=filesystem)
+    if columns is not None:
+        columns = [name for name in columns if name in dataset.schema.names]
+    return dataset.to_table(columns=columns, filter=row_filter)
+
+
+def _partition_values(path: str) -> Dict[str, str]:
+    """Hive-style key=value directories of an object path"""
+    return dict(part.split("=", 1) for part in path.split("/")[:-1] if "=" in part)
+
+
+def _partition_path_filter(
+    start_time: datetime,
+    end_time: datetime,
+    source_system: Optional[str] = None
+) -> Callable[[str], bool]:
+    """
+    Build a predicate on partition paths (.../date=/hour=/source=/file)
+    
+    A path passes if its directories can hold rows in [start_time,
+    end_time] from source_system; the exact filter is applied on read.
+    """
+    first_hour = start_time.replace(minute=0, second=0, microsecond=0, tzinfo=None)
+    last_time = end_time.replace(tzinfo=None)
+    
+    def in_range(path: str) -> bool:
+        values = _partition_values(path)
+        if source_system and values.get("source") != source_system:
+            return False
+        if "date" in values and "hour" in values:
+            hour_start = datetime.strptime(f"{values['date']} {values['hour']}", "%Y-%m-%d %H")
+            return first_hour <= hour_start <= last_time
+        return True
+    
+    return in_range
+
+
+# ===== PARTITION SPOOLING =====
+
+@dataclass
+class _PartitionSpool:
+    """One partition's open local Parquet file between uploads"""
+    prefix: str  # Object key prefix of the partition
+    schema: pa.Schema
+    path: Path
+    writer: Optional[pq.ParquetWriter] = None
+    pending: List[pa.Table] = field(default_factory=list)  # Rows not yet in a row group
+    pending_rows: int = 0
+    num_rows: int = 0
+    last_write: float = 0.0  # time.monotonic() of the last append
+    lock: threading.Lock = field(default_factory=threading.Lock)
+
+
 class StorageLayer:
     """
     Manages event storage across hot/warm/cold tiers
     Provides read/write interfaces for event data
     """
     
+    # Buckets already checked/created in this process (skips HeadBucket)
+    _verified_buckets: ClassVar[Set[str]] = set()
+    # Buckets whose cold-tier expiration rule is installed
+    _expiring_buckets: ClassVar[Set[str]] = set()
+    
     def __init__(self, config: StorageConfig):
         self.config = config
         self.s3_client = self._init_s3_client()
+        self.arrow_fs = self._init_arrow_fs()
+        self._upload_executor: Optional[ThreadPoolExecutor] = None
+        self._read_executor: Optional[ThreadPoolExecutor] = None
+        
+        # (compression, level) per tier, resolved once, not per partition
+        self._compression = _tier_compression(config)
+        
+        # Open partition files, keyed by (tier, date, hour, source)
+        self._spools: Dict[Tuple[str, str, int, str], _PartitionSpool] = {}
+        self._spools_lock = threading.Lock()
+        self._spool_dir = Path(config.spool_dir)
+        # Finished spool files whose upload failed: (path, object key)
+        self._failed_uploads: List[Tuple[Path, str]] = []
+        self._failed_lock = threading.Lock()
+        self._closed = threading.Event()
+        self._spool_timer: Optional[threading.Thread] = None
         self._ensure_bucket_exists()
+        if config.bucket_lifecycle_expiration:
+            self._ensure_lifecycle_rules()
+        
+        if config.spool_partitions:
+            self._spool_dir.mkdir(parents=True, exist_ok=True)
+            
+            # Finished files a previous run could not upload are retried;
+            # unfinished ones (no .key sidecar) have no Parquet footer and
+            # cannot be recovered
+            lost = 0
+            for path in self._spool_dir.glob("*.parquet"):
+                key_path = path.with_suffix(".key")
+                if key_path.exists():
+                    self._failed_uploads.append((path, key_path.read_text()))
+                else:
+                    lost += 1
+            if self._failed_uploads:
+                logger.info(f"Retrying {len(self._failed_uploads)} spool uploads left by a previous run")
+            if lost:
+                logger.warning(
+                    f"{lost} unfinished spool files in {self._spool_dir} were left by a "
+                    f"previous run; their events are lost"
+                )
+            
+            # Idle partitions are uploaded even when no more writes arrive
+            self._spool_timer = threading.Thread(
+                target=self._run_spool_timer,
+                name="storage-spool-timer",
+                daemon=True
+            )
+            self._spool_timer.start()
         
     def _init_s3_client(self):
-        """Initialize S3/MinIO client"""
+        """Initialize S3/MinIO client (shared by all worker threads)"""
+        # Sized for the upload/read pools; adaptive retries back off on
+        # throttling instead of failing the batch
+        client_config = Config(
+            signature_version='s3v4',
+            max_pool_connections=self.config.max_pool_connections,
+            retries={'max_attempts': self.config.max_retry_attempts, 'mode': 'adaptive'},
+            tcp_keepalive=True
+        )
+        
         if self.config.backend == "minio":
             return boto3.client(
                 's3',
                 endpoint_url=self.config.endpoint_url,
                 aws_access_key_id=self.config.access_key,
                 aws_secret_access_key=self.config.secret_key,
-                config=Config(signature_version='s3v4'),
+                config=client_config.merge(Config(s3={'addressing_style': 'path'})),
                 region_name=self.config.region
             )
         else:  # AWS S3
@@ -71,15 +455,64 @@ class StorageLayer:
                 's3',
                 aws_access_key_id=self.config.access_key,
                 aws_secret_access_key=self.config.secret_key,
+                config=client_config,
                 region_name=self.config.region
             )
 
+    def _init_arrow_fs(self) -> pafs.S3FileSystem:
+        """
+        Initialize Arrow's native S3 filesystem (used for Parquet writes)
+        
+        Writes stream row groups straight into S3 multipart uploads from
+        Arrow's own I/O threads, instead of staging the file in memory.
+        """
+        endpoint_override = None
+        scheme = "https"
+        if self.config.backend == "minio" and self.config.endpoint_url:
+            endpoint = urlparse(self.config.endpoint_url)
+            endpoint_override = endpoint.netloc or endpoint.path
+            scheme = endpoint.scheme or "http"
+        
+        return pafs.S3FileSystem(
+            access_key=self.config.access_key,
+            secret_key=self.config.secret_key,
+            region=self.config.region,
+            endpoint_override=endpoint_override,
+            scheme=scheme,
+            retry_strategy=pafs.AwsStandardS3RetryStrategy(
+                max_attempts=self.config.max_retry_attempts
+            )
+        )
+    
+    def _get_upload_executor(self) -> ThreadPoolExecutor:
+        """Lazily create the thread pool used for concurrent partition uploads"""
+        if self._upload_executor is None:
+            self._upload_executor = ThreadPoolExecutor(
+                max_workers=self.config.upload_workers,
+                thread_name_prefix="storage-upload"
+            )
+        return self._upload_executor
+    
+    def _get_read_executor(self) -> ThreadPoolExecutor:
+        """Lazily create the thread pool used for concurrent file reads"""
+        if self._read_executor is None:
+            self._read_executor = ThreadPoolExecutor(
+                max_workers=self.config.read_workers,
+                thread_name_prefix="storage-read"
+            )
+        return self._read_executor
+    
     def _ensure_bucket_exists(self):
-        """Create bucket if it doesn't exist"""
+        """Create bucket if it doesn't exist (once per bucket per process)"""
+        if self.config.skip_bucket_check or self.config.bucket_name in StorageLayer._verified_buckets:
+            return
+        
         try:
             self.s3_client.head_bucket(Bucket=self.config.bucket_name)
-        except:
-            print(f"Creating bucket: {self.config.bucket_name}")
+        except ClientError as e:
+            if e.response.get("Error", {}).get("Code") not in ("404", "NoSuchBucket", "NotFound"):
+                raise
+            logger.info(f"Creating bucket: {self.config.bucket_name}")
             if self.config.backend == "minio":
                 self.s3_client.create_bucket(Bucket=self.config.bucket_name)
             else:
@@ -91,6 +524,49 @@ class StorageLayer:
                         Bucket=self.config.bucket_name,
                         CreateBucketConfiguration={'LocationConstraint': self.config.region}
                     )
+        
+        StorageLayer._verified_buckets.add(self.config.bucket_name)
+    
+    def _ensure_lifecycle_rules(self):
+        """
+        Install a bucket rule expiring cold-tier objects past retention
+        
+        Tiers are key prefixes, so hot → warm → cold moves still need a
+        copy; only the final delete can be handed to the object store.
+        PutBucketLifecycleConfiguration replaces the whole configuration,
+        so the bucket's other rules are read and written back with ours.
+        On failure (e.g. no lifecycle permission) the bucket is left as
+        is and lifecycle_management deletes cold data itself.
+        """
+        bucket = self.config.bucket_name
+        if bucket in StorageLayer._expiring_buckets:
+            return
+        
+        rule = {
+            'ID': 'ztbf-cold-expiration',
+            'Filter': {'Prefix': 'cold/'},
+            'Status': 'Enabled',
+            'Expiration': {'Days': self.config.cold_retention_days}
+        }
+        
+        try:
+            try:
+                rules = self.s3_client.get_bucket_lifecycle_configuration(Bucket=bucket)['Rules']
+            except ClientError as e:
+                if e.response.get("Error", {}).get("Code") != "NoSuchLifecycleConfiguration":
+                    raise
+                rules = []
+            
+            rules = [existing for existing in rules if existing.get('ID') != rule['ID']] + [rule]
+            self.s3_client.put_bucket_lifecycle_configuration(
+                Bucket=bucket,
+                LifecycleConfiguration={'Rules': rules}
+            )
+        except Exception as e:
+            logger.warning(f"Could not install cold-tier expiration on {bucket}, deleting client-side: {e}")
+            return
+        
+        StorageLayer._expiring_buckets.add(bucket)
 
     def write_events(self, events: List[Dict], tier: str = "hot"):
         """
@@ -103,64 +579,327 @@ class StorageLayer:
         if not events:
             return
         
-        # Convert to DataFrame
-        df = pd.DataFrame(events)
+        # Split by source first (sources have different source_specific
+        # shapes), then build one Arrow table per source - no pandas.
+        # Every partition keeps the batch's full column set.
+        names = _column_names(events)
+        partitions = []
+        for source, source_events in _group_by_source(events).items():
+            table = _events_to_table(source_events, names)
+            for (date, hour), partition in _split_by_hour(table):
+                partitions.append((partition, (date, hour, source)))
         
-        # Ensure timestamp is datetime
-        if 'timestamp' in df.columns:
-            df['timestamp'] = pd.to_datetime(df['timestamp'])
+        self._write_partitions(partitions, tier)
+    
+    def write_events_arrow(self, table: pa.Table, tier: str = "hot"):
+        """
+        Write a pre-built Arrow table of events to storage
         
-        # Add partition columns
-        df['date'] = df['timestamp'].dt.date.astype(str)
-        df['hour'] = df['timestamp'].dt.hour
+        For producers that already hold columnar data: skips the per-event
+        dict stage of write_events entirely.
         
-        # Group by partition keys
-        partition_cols = ['date', 'hour', 'source_system']
-        for partition_values, group_df in df.groupby(partition_cols):
-            self._write_partition(group_df, partition_values, tier)
+        Args:
+            table: Events table (unified schema columns, timestamp-typed
+                   "timestamp" and a "source_system" column)
+            tier: Storage tier ("hot", "warm", or "cold")
+        """
+        if table.num_rows == 0:
+            return
+        
+        # Tables built with from_pandas carry pandas index/dtype metadata,
+        # which would otherwise be repeated in every file footer
+        table = table.replace_schema_metadata(None)
+        
+        partitions = []
+        for source, source_table in _split_by_source(table):
+            for (date, hour), partition in _split_by_hour(source_table):
+                partitions.append((partition, (date, hour, source)))
+        
+        self._write_partitions(partitions, tier)
+    
+    def _write_partitions(self, partitions: List[Tuple[pa.Table, tuple]], tier: str):
+        """Write (table, (date, hour, source)) partitions, concurrently if several"""
+        if len(partitions) == 1:
+            partition, values = partitions[0]
+            self._write_partition(partition, values, tier)
+        else:
+            # Encoding and uploads overlap across threads
+            executor = self._get_upload_executor()
+            futures = [
+                executor.submit(self._write_partition, partition, values, tier)
+                for partition, values in partitions
+            ]
+            wait(futures)
+            for future in futures:
+                future.result()
+        
+        # Partitions whose hour has passed stop receiving writes and go idle
+        self.close_stale_writers()
     
-    def _write_partition(self, df: pd.DataFrame, partition_values: tuple, tier: str):
-        """Write a single partition to storage"""
+    def _write_partition(self, table: pa.Table, partition_values: tuple, tier: str):
+        """
+        Write a single partition (Arrow table)
+        
+        Without spool_partitions the table is uploaded as its own object
+        before returning. With it, the table is appended to the partition's
+        spool file: rows are buffered until a full row group is available,
+        so spooled files keep scan-friendly row groups, and the file is
+        uploaded once it reaches spool_max_bytes, when it goes idle
+        (close_stale_writers, also run by the spool timer), or when a batch
+        arrives whose schema it cannot take.
+        """
         date, hour, source = partition_values
+        if not self.config.spool_partitions:
+            self._upload_table(table, self._partition_prefix(tier, date, hour, source), tier)
+            return
         
-        # Construct S3 key (path)
-        key = f"{tier}/date={date}/hour={hour:02d}/source={source}/events.parquet"
+        spool_key = (tier, date, hour, source)
         
-        # Select compression based on tier
-        compression_map = {
-            "hot": self.config.hot_compression,
-            "warm": self.config.warm_compression,
-            "cold": self.config.cold_compression
-        }
-        compression = compression_map.get(tier, "snappy")
+        while True:
+            spool = self._get_spool(spool_key, table.schema)
+            with spool.lock:
+                if self._spools.get(spool_key) is not spool:
+                    continue  # Uploaded by another thread meanwhile
+                
+                conformed = _conform_to_schema(table, spool.schema)
+                if conformed is None and spool.writer is None:
+                    # Nothing written yet - the file schema can still widen
+                    conformed = self._widen_spool(spool, table)
+                if conformed is None:
+                    # Incompatible schema (e.g. new source_specific keys):
+                    # upload what we have and start a new file
+                    self._detach_spool(spool_key, spool)
+                    self._upload_spool(spool, tier)
+                    continue
+                
+                spool.pending.append(conformed)
+                spool.pending_rows += conformed.num_rows
+                spool.num_rows += conformed.num_rows
+                spool.last_write = time.monotonic()
+                
+                if spool.pending_rows >= self.config.row_group_size:
+                    self._flush_row_groups(spool, tier)
+                
+                if spool.writer is not None and spool.path.stat().st_size >= self.config.spool_max_bytes:
+                    self._detach_spool(spool_key, spool)
+                    self._upload_spool(spool, tier)
+                return
+    
+    def _widen_spool(self, spool: _PartitionSpool, table: pa.Table) -> Optional[pa.Table]:
+        """
+        Widen a not-yet-written spool's schema to also fit table
         
-        # Convert to Parquet bytes
-        table = pa.Table.from_pandas(df)
+        Returns:
+            table conformed to the widened schema, or None (spool unchanged)
+        """
+        schema = _widen_schema(spool.schema, table.schema)
+        if schema is None:
+            return None
         
-        # Write to buffer
-        import io
-        buffer = io.BytesIO()
-        pq.write_table(table, buffer, compression=compression)
-        buffer.seek(0)
+        widened = [_conform_to_schema(pending, schema) for pending in spool.pending + [table]]
+        if any(part is None for part in widened):
+            return None
         
-        # Upload to S3/MinIO
+        spool.schema = schema
+        spool.pending = widened[:-1]
+        return widened[-1]
+    
+    def _get_spool(self, spool_key: tuple, schema: pa.Schema) -> _PartitionSpool:
+        """Get the open spool for a partition, creating it if needed"""
+        with self._spools_lock:
+            spool = self._spools.get(spool_key)
+            if spool is None:
+                spool = _PartitionSpool(
+                    prefix=self._partition_prefix(*spool_key),
+                    schema=schema,
+                    path=self._spool_dir / f"{uuid.uuid4().hex}.parquet"
+                )
+                self._spools[spool_key] = spool
+            return spool
+    
+    @staticmethod
+    def _partition_prefix(tier: str, date: str, hour: int, source: str) -> str:
+        """Object key prefix of a partition"""
+        return f"{tier}/date={date}/hour={hour:02d}/source={source}"
+    
+    def _upload_table(self, table: pa.Table, prefix: str, tier: str):
+        """Encode a partition table straight into a new object (no spooling)"""
+        compression, compression_level = self._compression.get(tier, ("zstd", 1))
+        if 'timestamp' in table.column_names:
+            table = table.sort_by('timestamp')
+        
+        key = f"{prefix}/events-{uuid.uuid4().hex}.parquet"
         try:
-            self.s3_client.put_object(
-                Bucket=self.config.bucket_name,
-                Key=key,
-                Body=buffer.getvalue()
-            )
-            print(f"Wrote {len(df)} events to {tier}/{key}")
+            with self.arrow_fs.open_output_stream(f"{self.config.bucket_name}/{key}") as sink:
+                pq.write_table(
+                    table,
+                    sink,
+                    compression=compression,
+                    compression_level=compression_level,
+                    data_page_size=self.config.data_page_size,
+                    row_group_size=self.config.row_group_size,
+                    write_statistics=True
+                )
+            logger.debug("Wrote %d events to %s/%s", table.num_rows, tier, key)
         except Exception as e:
-            print(f"Error writing to storage: {e}")
+            logger.error(f"Error writing to storage: {e}")
             raise
-
+    
+    def _detach_spool(self, spool_key: tuple, spool: _PartitionSpool):
+        """Remove a spool from the open set (caller then uploads it)"""
+        with self._spools_lock:
+            if self._spools.get(spool_key) is spool:
+                del self._spools[spool_key]
+    
+    def _flush_row_groups(self, spool: _PartitionSpool, tier: str):
+        """Write a spool's buffered rows to its local file as row groups"""
+        if not spool.pending:
+            return
+        
+        if spool.writer is None:
+            compression, compression_level = self._compression.get(tier, ("zstd", 1))
+            spool.writer = pq.ParquetWriter(
+                str(spool.path),
+                spool.schema,
+                compression=compression,
+                compression_level=compression_level,
+                data_page_size=self.config.data_page_size,
+                write_statistics=True
+            )
+        
+        buffered = pa.concat_tables(spool.pending)
+        if 'timestamp' in buffered.column_names:
+            # Clustered row groups keep timestamp min/max tight for pruning
+            buffered = buffered.sort_by('timestamp')
+        spool.writer.write_table(buffered, row_group_size=self.config.row_group_size)
+        spool.pending = []
+        spool.pending_rows = 0
+    
+    def _upload_spool(self, spool: _PartitionSpool, tier: str):
+        """
+        Finish a detached spool's file and upload it as one object
+        
+        Never raises: the rows came from batches that already returned, so
+        a failure is kept for retry rather than surfaced to whichever
+        write happens to trigger the upload.
+        """
+        try:
+            self._flush_row_groups(spool, tier)
+            if spool.writer is None:
+                return
+            spool.writer.close()
+        except Exception as e:
+            logger.error(f"Error finishing spool file {spool.path}, {spool.num_rows} events lost: {e}")
+            return
+        
+        # Unique object per upload; readers scan every file in the partition.
+        # The key is recorded next to the finished file so a failed upload
+        # can be retried, also after a restart.
+        key = f"{spool.prefix}/events-{uuid.uuid4().hex}.parquet"
+        spool.path.with_suffix(".key").write_text(key)
+        if not self._upload_spool_file(spool.path, key):
+            with self._failed_lock:
+                self._failed_uploads.append((spool.path, key))
+    
+    def _upload_spool_file(self, path: Path, key: str) -> bool:
+        """Upload a finished spool file and remove it locally (False on failure)"""
+        try:
+            with pafs.LocalFileSystem().open_input_stream(str(path)) as source, \
+                    self.arrow_fs.open_output_stream(f"{self.config.bucket_name}/{key}") as sink:
+                sink.upload(source)
+        except Exception as e:
+            logger.error(f"Error uploading {path} to {key}, will retry: {e}")
+            return False
+        
+        logger.info("Wrote %s to %s", path.name, key)
+        path.unlink()
+        path.with_suffix(".key").unlink()
+        return True
+    
+    def _retry_failed_uploads(self):
+        """Try again to upload spool files whose upload failed"""
+        with self._failed_lock:
+            failed, self._failed_uploads = self._failed_uploads, []
+        
+        # Taken out of the list while uploading, so concurrent callers
+        # never upload the same file twice
+        still_failed = [
+            (path, key) for path, key in failed
+            if not self._upload_spool_file(path, key)
+        ]
+        if still_failed:
+            with self._failed_lock:
+                self._failed_uploads.extend(still_failed)
+    
+    def close_stale_writers(self, max_idle_seconds: Optional[float] = None):
+        """
+        Upload spooled partitions that have not been written to recently
+        
+        Files whose upload failed earlier are retried first.
+        
+        Args:
+            max_idle_seconds: Idle threshold (default: config.spool_idle_seconds;
+                              0 uploads every open partition)
+        """
+        if self._failed_uploads:
+            self._retry_failed_uploads()
+        
+        if max_idle_seconds is None:
+            max_idle_seconds = self.config.spool_idle_seconds
+        cutoff = time.monotonic() - max_idle_seconds
+        
+        with self._spools_lock:
+            stale = [
+                (spool_key, spool) for spool_key, spool in self._spools.items()
+                if spool.last_write <= cutoff
+            ]
+        
+        for spool_key, spool in stale:
+            with spool.lock:
+                if self._spools.get(spool_key) is not spool:
+                    continue
+                self._detach_spool(spool_key, spool)
+                self._upload_spool(spool, spool_key[0])
+    
+    def flush(self):
+        """Upload every spooled partition"""
+        self.close_stale_writers(max_idle_seconds=0)
+    
+    def _run_spool_timer(self):
+        """Background loop uploading idle spooled partitions"""
+        while not self._closed.wait(self.config.spool_check_seconds):
+            try:
+                self.close_stale_writers()
+            except Exception as e:
+                logger.error(f"Error uploading idle partitions: {e}")
+    
+    def close(self):
+        """Stop the spool timer, upload everything spooled, release thread pools"""
+        self._closed.set()
+        if self._spool_timer is not None:
+            self._spool_timer.join()
+            self._spool_timer = None
+        
+        self.flush()
+        if self._failed_uploads:
+            logger.error(
+                f"{len(self._failed_uploads)} spool files could not be uploaded; "
+                f"they stay in {self._spool_dir} and are retried on the next start"
+            )
+        
+        for executor in (self._upload_executor, self._read_executor):
+            if executor is not None:
+                executor.shutdown(wait=True)
+        self._upload_executor = None
+        self._read_executor = None
+    
     def read_events(
         self,
         start_time: datetime,
         end_time: datetime,
         source_system: Optional[str] = None,
-        tier: Optional[str] = None
+        tier: Optional[str] = None,
+        columns: Optional[List[str]] = None
     ) -> pd.DataFrame:
         """
         Read events from storage
@@ -170,6 +909,9 @@ class StorageLayer:
             end_time: End of time range
             source_system: Filter by source (e.g., "azure_ad")
             tier: Read from specific tier, or None for all tiers
+            columns: Columns to read (timestamp and source_system are
+                always included), or None for all. Name them where you
+                can - unread column chunks are never fetched or decoded.
         
         Returns:
             DataFrame of events
@@ -189,28 +931,46 @@ class StorageLayer:
             date_str = current_date.strftime("%Y-%m-%d")
             
             for tier_name in tiers:
-                if source_system:
-                    prefix = f"{tier_name}/date={date_str}/hour=*/source={source_system}/"
-                else:
-                    prefix = f"{tier_name}/date={date_str}/"
-                
-                prefixes.append(prefix)
+                prefixes.append(f"{tier_name}/date={date_str}/")
             
             current_date += timedelta(days=1)
         
-        # Read all matching partitions
-        dfs = []
-        for prefix in prefixes:
-            partition_dfs = self._read_prefix(prefix)
-            dfs.extend(partition_dfs)
+        # Prune by the hour/source directories in each listed key (object
+        # stores don't expand "hour=*" in a prefix, so list per day)
+        in_range = _partition_path_filter(start_time, end_time, source_system)
+        
+        # Exact time range (and source) is pushed down into the Parquet
+        # reader, which skips row groups using their min/max statistics
+        row_filter = (pc.field('timestamp') >= start_time) & (pc.field('timestamp') <= end_time)
+        if source_system:
+            row_filter &= pc.field('source_system') == source_system
+        
+        columns = _with_key_columns(columns)
+        
+        # Read all matching files concurrently; each read is mostly S3 latency
+        paths = [
+            path for prefix in prefixes
+            for path in self._list_parquet_files(prefix)
+            if in_range(path)
+        ]
+        if len(paths) > 1:
+            executor = self._get_read_executor()
+            results = list(executor.map(lambda path: self._read_file(path, row_filter, columns), paths))
+        else:
+            results = [self._read_file(path, row_filter, columns) for path in paths]
+        tables = [table for table in results if table is not None]
         
-        if not dfs:
+        if not tables:
             return pd.DataFrame()
         
-        # Concatenate and filter by exact time range
-        df = pd.concat(dfs, ignore_index=True)
-        df['timestamp'] = pd.to_datetime(df['timestamp'])
-        df = df[(df['timestamp'] >= start_time) & (df['timestamp'] <= end_time)]
+        # Arrow buffers are released column by column as pandas takes them
+        table = _concat_tables(tables)
+        del tables, results
+        df = table.to_pandas(self_destruct=True, split_blocks=True)
+        del table
+        if df['timestamp'].dtype.kind != 'M':
+            # Only files whose timestamp lost its Parquet type need parsing
+            df['timestamp'] = pd.to_datetime(df['timestamp'])
         
         return df
 
@@ -236,42 +996,52 @@ class StorageLayer:
         
         return tiers if tiers else ["hot"]  # Default to hot if no tiers match
 
-    def _read_prefix(self, prefix: str) -> List[pd.DataFrame]:
-        """Read all Parquet files under a given prefix"""
-        dfs = []
+    def _list_parquet_files(self, prefix: str) -> List[str]:
+        """
+        List the Parquet files under a given prefix
         
+        Listing goes through Arrow's native S3 filesystem, which pages past
+        the 1000-key ListObjectsV2 limit on its own.
+        """
         try:
-            # List objects with prefix
-            response = self.s3_client.list_objects_v2(
-                Bucket=self.config.bucket_name,
-                Prefix=prefix
+            selector = pafs.FileSelector(
+                f"{self.config.bucket_name}/{prefix}".rstrip("/"),
+                recursive=True,
+                allow_not_found=True
             )
-            
-            if 'Contents' not in response:
-                return dfs
-            
-            # Read each Parquet file
-            for obj in response['Contents']:
-                key = obj['Key']
-                if not key.endswith('.parquet'):
-                    continue
-                
-                # Download file
-                response = self.s3_client.get_object(
-                    Bucket=self.config.bucket_name,
-                    Key=key
-                )
-                
-                # Read Parquet
-                import io
-                buffer = io.BytesIO(response['Body'].read())
-                df = pd.read_parquet(buffer)
-                dfs.append(df)
+            return [
+                info.path for info in self.arrow_fs.get_file_info(selector)
+                if info.type == pafs.FileType.File and info.path.endswith('.parquet')
+            ]
         
         except Exception as e:
-            print(f"Error reading from {prefix}: {e}")
+            logger.error(f"Error listing {prefix}: {e}")
+            return []
+    
+    def _read_file(
+        self,
+        path: str,
+        row_filter: Optional[pc.Expression] = None,
+        columns: Optional[List[str]] = None
+    ) -> Optional[pa.Table]:
+        """
+        Read one Parquet file with Arrow's native S3 filesystem
+        
+        Args:
+            path: Bucket-qualified object path
+            row_filter: Predicate applied while reading; row groups whose
+                statistics cannot match are never fetched
+            columns: Columns to read, or None for all
         
-        return dfs
+        Returns:
+            Arrow table, or None if the read failed
+        """
+        try:
+            return _read_parquet(path, columns, row_filter, filesystem=self.arrow_fs)
+        
+        except Exception as e:
+            logger.error(f"Error reading {path}: {e}")
+            return None
     
     def lifecycle_management(self):
         """
@@ -288,77 +1058,94 @@ class StorageLayer:
         warm_cutoff = now - timedelta(days=self.config.warm_retention_days)
         self._move_tier("warm", "cold", warm_cutoff)
         
-        # Delete cold data past retention
-        cold_cutoff = now - timedelta(days=self.config.cold_retention_days)
-        self._delete_old_data("cold", cold_cutoff)
+        # Delete cold data past retention (unless the bucket's own rule
+        # was installed and expires it)
+        if self.config.bucket_name not in StorageLayer._expiring_buckets:
+            cold_cutoff = now - timedelta(days=self.config.cold_retention_days)
+            self._delete_old_data("cold", cold_cutoff)
     
     def _move_tier(self, from_tier: str, to_tier: str, cutoff_date: datetime):
         """Move data from one tier to another"""
-        # List all objects in from_tier
         prefix = f"{from_tier}/"
         
         try:
-            response = self.s3_client.list_objects_v2(
-                Bucket=self.config.bucket_name,
-                Prefix=prefix
-            )
-            
-            if 'Contents' not in response:
+            expired = [
+                obj['Key'] for obj in self._iter_objects(prefix)
+                if obj['LastModified'].replace(tzinfo=None) < cutoff_date
+            ]
+            if not expired:
                 return
             
-            for obj in response['Contents']:
-                key = obj['Key']
-                last_modified = obj['LastModified']
-                
-                # Check if old enough to move
-                if last_modified.replace(tzinfo=None) < cutoff_date:
-                    # Construct new key in destination tier
-                    new_key = key.replace(from_tier + "/", to_tier + "/", 1)
-                    
-                    # Copy to new tier
+            def copy_to_tier(key: str) -> Optional[str]:
+                # Construct new key in destination tier
+                new_key = key.replace(from_tier + "/", to_tier + "/", 1)
+                try:
                     self.s3_client.copy_object(
                         Bucket=self.config.bucket_name,
                         CopySource={'Bucket': self.config.bucket_name, 'Key': key},
                         Key=new_key
                     )
-                    
-                    # Delete from old tier
-                    self.s3_client.delete_object(
-                        Bucket=self.config.bucket_name,
-                        Key=key
-                    )
-                    
-                    print(f"Moved {key} → {new_key}")
+                except Exception as e:
+                    logger.error(f"Error copying {key} → {new_key}: {e}")
+                    return None
+                logger.debug("Moved %s → %s", key, new_key)
+                return key
+            
+            # Copies are independent server-side operations
+            copied = self._get_upload_executor().map(copy_to_tier, expired)
+            
+            # Only delete what actually reached the destination tier
+            moved = self._delete_keys([key for key in copied if key is not None])
+            logger.info(f"Moved {len(moved)} objects {from_tier} → {to_tier}")
         
         except Exception as e:
-            print(f"Error moving data from {from_tier} to {to_tier}: {e}")
+            logger.error(f"Error moving data from {from_tier} to {to_tier}: {e}")
     
     def _delete_old_data(self, tier: str, cutoff_date: datetime):
         """Delete data older than cutoff date"""
         prefix = f"{tier}/"
         
         try:
-            response = self.s3_client.list_objects_v2(
+            expired = [
+                obj['Key'] for obj in self._iter_objects(prefix)
+                if obj['LastModified'].replace(tzinfo=None) < cutoff_date
+            ]
+            deleted = self._delete_keys(expired)
+            if deleted:
+                logger.info(f"Deleted {len(deleted)} expired objects from {tier}")
+        
+        except Exception as e:
+            logger.error(f"Error deleting old data from {tier}: {e}")
+    
+    def _iter_objects(self, prefix: str) -> Iterator[Dict]:
+        """Yield every object under a prefix (pages past the 1000-key limit)"""
+        paginator = self.s3_client.get_paginator('list_objects_v2')
+        for page in paginator.paginate(Bucket=self.config.bucket_name, Prefix=prefix):
+            yield from page.get('Contents', [])
+    
+    def _delete_keys(self, keys: List[str]) -> List[str]:
+        """
+        Delete objects in batches of 1000 (one DeleteObjects request each)
+        
+        Returns:
+            Keys that were deleted
+        """
+        deleted = []
+        
+        for start in range(0, len(keys), 1000):
+            chunk = keys[start:start + 1000]
+            response = self.s3_client.delete_objects(
                 Bucket=self.config.bucket_name,
-                Prefix=prefix
+                Delete={'Objects': [{'Key': key} for key in chunk], 'Quiet': True}
             )
             
-            if 'Contents' not in response:
-                return
-            
-            for obj in response['Contents']:
-                key = obj['Key']
-                last_modified = obj['LastModified']
-                
-                if last_modified.replace(tzinfo=None) < cutoff_date:
-                    self.s3_client.delete_object(
-                        Bucket=self.config.bucket_name,
-                        Key=key
-                    )
-                    print(f"Deleted {key} (expired)")
+            # Quiet mode only reports failures
+            failed = {error['Key'] for error in response.get('Errors', [])}
+            for error in response.get('Errors', []):
+                logger.error(f"Error deleting {error['Key']}: {error.get('Message')}")
+            deleted.extend(key for key in chunk if key not in failed)
         
-        except Exception as e:
-            print(f"Error deleting old data from {tier}: {e}")
+        return deleted
     
     def get_statistics(self) -> Dict:
         """Get storage statistics"""
@@ -372,21 +1159,15 @@ class StorageLayer:
             prefix = f"{tier}/"
             
             try:
-                response = self.s3_client.list_objects_v2(
-                    Bucket=self.config.bucket_name,
-                    Prefix=prefix
-                )
-                
-                if 'Contents' in response:
-                    stats[tier]["count"] = len(response['Contents'])
-                    stats[tier]["size_bytes"] = sum(obj['Size'] for obj in response['Contents'])
+                for obj in self._iter_objects(prefix):
+                    stats[tier]["count"] += 1
+                    stats[tier]["size_bytes"] += obj['Size']
             
             except Exception as e:
-                print(f"Error getting stats for {tier}: {e}")
+                logger.error(f"Error getting stats for {tier}: {e}")
         
         return stats
 
-
 # ===== LOCAL FILESYSTEM STORAGE (FOR LIGHTWEIGHT TESTING) =====
 
 class LocalStorageLayer:
@@ -395,67 +1176,98 @@ class LocalStorageLayer:
     Useful for development without MinIO/S3
     """
     
-    def __init__(self, base_path: str = "data/events"):
+    def __init__(self, base_path: str = "data/events", config: Optional[StorageConfig] = None):
+        """
+        Args:
+            base_path: Root directory of the tier/partition tree
+            config: Only the per-tier compression settings are used
+                (default: StorageConfig defaults, as for S3)
+        """
         self.base_path = Path(base_path)
         self.base_path.mkdir(parents=True, exist_ok=True)
+        self._compression = _tier_compression(config or StorageConfig())
     
     def write_events(self, events: List[Dict], tier: str = "hot"):
         """Write events to local Parquet files"""
         if not events:
             return
         
-        df = pd.DataFrame(events)
-        df['timestamp'] = pd.to_datetime(df['timestamp'])
-        df['date'] = df['timestamp'].dt.date.astype(str)
-        df['hour'] = df['timestamp'].dt.hour
-        
-        # Write partitioned
-        for (date, hour, source), group_df in df.groupby(['date', 'hour', 'source_system']):
-            partition_dir = self.base_path / tier / f"date={date}" / f"hour={hour:02d}" / f"source={source}"
-            partition_dir.mkdir(parents=True, exist_ok=True)
-            
-            file_path = partition_dir / "events.parquet"
-            
-            # Append if file exists
-            if file_path.exists():
-                existing_df = pd.read_parquet(file_path)
-                combined_df = pd.concat([existing_df, group_df], ignore_index=True)
-                combined_df.to_parquet(file_path, compression='snappy', index=False)
-            else:
-                group_df.to_parquet(file_path, compression='snappy', index=False)
+        # Write partitioned, converting each source's rows to Arrow once
+        # (sources have different source_specific shapes) and slicing the
+        # date/hour partitions out of that table - no pandas
+        compression, compression_level = self._compression.get(tier, ("zstd", 1))
+        names = _column_names(events)
+        num_written = num_files = 0
+        for source, source_events in _group_by_source(events).items():
+            table = _events_to_table(source_events, names)
             
-            print(f"Wrote {len(group_df)} events to {file_path}")
+            for (date, hour), group_table in _split_by_hour(table):
+                partition_dir = self.base_path / tier / f"date={date}" / f"hour={hour:02d}" / f"source={source}"
+                partition_dir.mkdir(parents=True, exist_ok=True)
+                
+                # One new file per batch; readers union every file in the
+                # partition, so appends never rewrite what's already there
+                file_path = partition_dir / f"events-{uuid.uuid4().hex}.parquet"
+                num_events = group_table.num_rows
+                
+                pq.write_table(
+                    group_table,
+                    file_path,
+                    compression=compression,
+                    compression_level=compression_level
+                )
+                
+                logger.debug("Wrote %d events to %s", num_events, file_path)
+                num_written += num_events
+                num_files += 1
+        
+        logger.info("Wrote %d events to %d partition files", num_written, num_files)
     
     def read_events(
         self,
         start_time: datetime,
         end_time: datetime,
         source_system: Optional[str] = None,
-        tier: Optional[str] = None
+        tier: Optional[str] = None,
+        columns: Optional[List[str]] = None
     ) -> pd.DataFrame:
         """Read events from local storage"""
         tiers = [tier] if tier else ["hot", "warm", "cold"]
-        dfs = []
+        columns = _with_key_columns(columns)
+        
+        # Filter by time range (and source) while reading each file
+        row_filter = (pc.field('timestamp') >= start_time) & (pc.field('timestamp') <= end_time)
+        if source_system:
+            row_filter &= pc.field('source_system') == source_system
+        
+        # Skip date directories outside the range without walking them,
+        # then prune the remaining files by hour/source directory
+        first_date, last_date = start_time.strftime("%Y-%m-%d"), end_time.strftime("%Y-%m-%d")
+        in_range = _partition_path_filter(start_time, end_time, source_system)
+        tables = []
         
         for tier_name in tiers:
             tier_path = self.base_path / tier_name
             if not tier_path.exists():
                 continue
             
-            # Recursively find all Parquet files
-            for parquet_file in tier_path.rglob("*.parquet"):
-                df = pd.read_parquet(parquet_file)
-                dfs.append(df)
+            for date_dir in tier_path.glob("date=*"):
+                if not first_date <= date_dir.name[len("date="):] <= last_date:
+                    continue
+                for parquet_file in date_dir.rglob("*.parquet"):
+                    if in_range(parquet_file.relative_to(tier_path).as_posix()):
+                        tables.append(_read_parquet(str(parquet_file), columns, row_filter))
         
-        if not dfs:
+        if not tables:
             return pd.DataFrame()
         
-        # Filter by time range
-        df = pd.concat(dfs, ignore_index=True)
-        df['timestamp'] = pd.to_datetime(df['timestamp'])
-        df = df[(df['timestamp'] >= start_time) & (df['timestamp'] <= end_time)]
-        
-        if source_system:
-            df = df[df['source_system'] == source_system]
+        # Combine in Arrow, then convert once
+        table = _concat_tables(tables)
+        del tables
+        df = table.to_pandas(self_destruct=True, split_blocks=True)
+        del table
+        if df['timestamp'].dtype.kind != 'M':
+            # Only files whose timestamp lost its Parquet type need parsing
+            df['timestamp'] = pd.to_datetime(df['timestamp'])
         
         return df
\ No newline at end of file
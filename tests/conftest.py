@@ -0,0 +1,5 @@
+import sys
+from pathlib import Path
+
+# Modules import as data_pipeline.*, rooted at src/
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent / "src"))
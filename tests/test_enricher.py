@@ -0,0 +1,43 @@
+"""
+Tests for EventEnricher PII redaction
+
+"""
+
+import pytest
+
+from data_pipeline.processing.enricher import EventEnricher
+
+
+@pytest.fixture
+def enricher():
+    return EventEnricher()
+
+
+@pytest.mark.parametrize("text, expected", [
+    ("call 555-123-4567 now", "call [PHONE] now"),
+    ("(555) 123-4567", "[PHONE]"),
+    ("5551234567", "[PHONE]"),
+    ("+1 555 123 4567", "[PHONE]"),
+    ("card 4111 1111 1111 1111", "card [CREDIT_CARD]"),
+    ("ssn 123-45-6789", "ssn [SSN]"),
+    ("contact bob@example.com", "contact [EMAIL]"),
+])
+def test_redacts_pii(enricher, text, expected):
+    event = enricher._anonymize_pii({"error_message": text})
+    assert event["error_message"] == expected
+
+
+@pytest.mark.parametrize("text", [
+    "User: arn:aws:iam::123456789012:user/bob is not authorized",
+    "request 1234567890123 failed",
+    "Mozilla/5.0 (Windows NT 10.0; Win64; x64) Chrome/120.0.6099.109",
+])
+def test_keeps_identifiers(enricher, text):
+    event = enricher._anonymize_pii({"error_message": text, "user_agent": text})
+    assert event["error_message"] == text
+    assert event["user_agent"] == text
+
+
+def test_exempt_fields_untouched(enricher):
+    event = enricher._anonymize_pii({"entity_id": "bob@example.com"})
+    assert event["entity_id"] == "bob@example.com"
@@ -0,0 +1,86 @@
+"""
+Tests for EventProcessor adaptive batch tuning
+
+"""
+
+import importlib
+
+import pytest
+
+
+class _Queue:
+    """Stands in for HybridQueue: the tuner only reads its size"""
+    
+    def __init__(self, size=0):
+        self.size = size
+    
+    def qsize(self):
+        return self.size
+
+
+@pytest.fixture
+def make_processor(tmp_path, monkeypatch):
+    # processor logs to logs/processor.log relative to the working directory
+    monkeypatch.chdir(tmp_path)
+    (tmp_path / "logs").mkdir()
+    processor = importlib.import_module("data_pipeline.processing.processor")
+    
+    def make(queue_size=0, **config):
+        config.setdefault("storage_path", str(tmp_path / "events"))
+        return processor.EventProcessor(_Queue(queue_size), processor.ProcessorConfig(**config))
+    
+    return make
+
+
+def _run_flushes(processor, fixed_ms, per_event_ms, flushes=30):
+    sizes = []
+    for _ in range(flushes):
+        size = processor._batch_size
+        processor._tune_batching((fixed_ms + per_event_ms * size) / 1000, size)
+        sizes.append(processor._batch_size)
+    return sizes
+
+
+def test_converges_to_latency_target(make_processor):
+    processor = make_processor(batch_size=1000, target_latency_ms=500)
+    _run_flushes(processor, fixed_ms=200, per_event_ms=0.5)
+    
+    # (500 - 200) / 0.5
+    assert processor._batch_size == pytest.approx(600, abs=6)
+    fixed_ms, per_event_ms = processor._flush_model
+    assert fixed_ms == pytest.approx(200, rel=0.05)
+    assert per_event_ms == pytest.approx(0.5, rel=0.05)
+
+
+def test_shrinks_at_most_half_per_flush(make_processor):
+    processor = make_processor(batch_size=1000, target_latency_ms=500)
+    sizes = _run_flushes(processor, fixed_ms=0, per_event_ms=20, flushes=8)
+    
+    assert sizes[:5] == [500, 250, 125, 62, 31]
+    assert sizes[-1] == 25
+
+
+def test_fixed_cost_over_target_keeps_full_batch(make_processor):
+    processor = make_processor(batch_size=1000, target_latency_ms=500)
+    _run_flushes(processor, fixed_ms=600, per_event_ms=0.1)
+    
+    assert processor._batch_size == 1000
+
+
+def test_backlog_lowers_timeout_until_drained(make_processor):
+    processor = make_processor(queue_size=10_000, batch_size=100, num_workers=4,
+                               batch_timeout_seconds=5, target_latency_ms=500)
+    processor._tune_batching(0.05, 100)
+    assert processor._batch_timeout == 0.5
+    
+    processor.event_queue.size = 0
+    processor._tune_batching(0.05, 100)
+    assert processor._batch_timeout == 5.0
+
+
+def test_disabled_without_target(make_processor):
+    processor = make_processor(batch_size=1000, target_latency_ms=0)
+    _run_flushes(processor, fixed_ms=0, per_event_ms=20, flushes=3)
+    
+    assert processor._batch_size == 1000
+    assert processor._flush_model is None
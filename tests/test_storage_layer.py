@@ -0,0 +1,57 @@
+"""
+Tests for LocalStorageLayer append-as-new-file writes
+
+"""
+
+from datetime import datetime, timedelta
+
+import pytest
+
+from data_pipeline.generators.synthetic_logs import SyntheticLogGenerator
+from data_pipeline.processing.normalizer import EventNormalizer
+from data_pipeline.storage.storage_layer import LocalStorageLayer
+
+HOUR = datetime(2024, 3, 5, 14)
+
+
+@pytest.fixture
+def storage(tmp_path):
+    return LocalStorageLayer(str(tmp_path / "events"))
+
+
+def _batch(seed, count=40):
+    """Normalized api_gateway events, all inside HOUR"""
+    raw_events = [
+        e for e in SyntheticLogGenerator(seed=seed).generate_normal_events(count * 6)
+        if e["source_type"] == "api_gateway"
+    ][:count]
+    events, failed = EventNormalizer().normalize_batch(raw_events)
+    assert not failed
+    for minute, event in enumerate(events):
+        event["timestamp"] = HOUR + timedelta(minutes=minute % 60)
+    return events
+
+
+def test_second_write_appends_new_file(storage):
+    first, second = _batch(seed=1), _batch(seed=2)
+    storage.write_events(first, tier="hot")
+    storage.write_events(second, tier="hot")
+    
+    partition = storage.base_path / "hot" / "date=2024-03-05" / "hour=14" / "source=api_gateway"
+    assert len(list(partition.glob("events-*.parquet"))) == 2
+    
+    df = storage.read_events(HOUR, HOUR + timedelta(hours=1), tier="hot")
+    assert len(df) == len(first) + len(second)
+    assert sorted(df["raw_event_id"]) == sorted(e["raw_event_id"] for e in first + second)
+    assert df["timestamp"].dtype.kind == "M"
+
+
+def test_read_filters_appended_files(storage):
+    storage.write_events(_batch(seed=1), tier="hot")
+    storage.write_events(_batch(seed=2), tier="hot")
+    
+    df = storage.read_events(HOUR, HOUR + timedelta(minutes=9), tier="hot", columns=["raw_event_id"])
+    assert len(df) == 2 * 10
+    
+    other_source = storage.read_events(HOUR, HOUR + timedelta(hours=1), source_system="azure_ad")
+    assert other_source.empty